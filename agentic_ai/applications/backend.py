@@ -6,28 +6,29 @@ Only two lines changed compared with your original file:
     STATE_STORE = get_state_store()  
 Everything else is untouched.  
 """  
-  
+
+from __future__ import annotations
+
 import json
 import os  
 import sys  
 import time
 import logging
 from pathlib import Path  
-from typing import Dict, List, Any, Optional, Set, DefaultDict
-from collections import defaultdict
+from typing import Any, Optional
 
 # Add parent directory to path for observability module
 sys.path.insert(0, str(Path(__file__).parent.parent))
   
 import httpx
 import jwt
+import orjson
 from jwt.algorithms import RSAAlgorithm
 import uvicorn  
-from fastapi import FastAPI, Depends, Header, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import APIRouter, FastAPI, Depends, Header, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi import status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
 from pydantic import BaseModel  
 from dotenv import load_dotenv  
 
@@ -93,8 +94,8 @@ AUTHORITY = os.getenv("AUTHORITY", "")
 if not AUTHORITY and not DISABLE_AUTH and AAD_TENANT_ID:
     AUTHORITY = f"https://login.microsoftonline.com/{AAD_TENANT_ID}"
 JWKS_URL_TEMPLATE = "https://login.microsoftonline.com/{tenant}/discovery/v2.0/keys"
-JWKS_CACHE: Dict[str, Dict[str, Any]] = {}
-JWKS_CACHE_EXPIRATION: Dict[str, float] = {}
+JWKS_CACHE: dict[str, dict[str, Any]] = {}
+JWKS_CACHE_EXPIRATION: dict[str, float] = {}
 JWKS_CACHE_TTL_SECONDS = 3600
 
 logger = logging.getLogger("auth")
@@ -102,7 +103,7 @@ if not logger.handlers:
     logging.basicConfig(level=logging.INFO)
 
 
-def _fetch_jwks(tenant_id: str) -> Dict[str, Any]:
+def _fetch_jwks(tenant_id: str) -> dict[str, Any]:
     now = time.time()
     cached = JWKS_CACHE.get(tenant_id)
     expires_at = JWKS_CACHE_EXPIRATION.get(tenant_id, 0)
@@ -142,7 +143,7 @@ def _build_public_key(token: str):
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Signing key not found")
 
 
-def _extract_email(claims: Dict[str, Any]) -> Optional[str]:
+def _extract_email(claims: dict[str, Any]) -> Optional[str]:
     for claim_name in ("preferred_username", "upn", "email"):
         value = claims.get(claim_name)
         if value:
@@ -150,7 +151,7 @@ def _extract_email(claims: Dict[str, Any]) -> Optional[str]:
     return None
 
 
-def _enforce_allowed_domain(claims: Dict[str, Any]) -> None:
+def _enforce_allowed_domain(claims: dict[str, Any]) -> None:
     if not ALLOWED_EMAIL_DOMAIN_LOWER:
         return
     email = _extract_email(claims)
@@ -158,7 +159,7 @@ def _enforce_allowed_domain(claims: Dict[str, Any]) -> None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Email domain not permitted")
 
 
-def _validate_jwt(token: str) -> Dict[str, Any]:
+def _validate_jwt(token: str) -> dict[str, Any]:
     if DISABLE_AUTH:
         return {"sub": "dev-anon"}
     if not token:
@@ -209,7 +210,7 @@ DEFAULT_AVAILABLE_AGENTS = [
     "agents.agent_framework.multi_agent.reflection_agent",
 ]
 
-def _load_available_agents() -> List[str]:
+def _load_available_agents() -> list[str]:
     raw = os.getenv("AGENT_MODULES")
     if not raw:
         return DEFAULT_AVAILABLE_AGENTS
@@ -221,11 +222,20 @@ AVAILABLE_AGENTS = _load_available_agents()
 # Current active agent module (can be changed at runtime)
 CURRENT_AGENT_MODULE = AVAILABLE_AGENTS[0]
 
+# Agent classes already resolved, keyed by module path (switching back and
+# forth via /agent/select then skips the import machinery entirely)
+_AGENT_CLASS_CACHE: dict[str, type] = {}
+
 def load_agent_class(module_path: str):
     """Dynamically load and return the Agent class from the given module path."""
+    cached = _AGENT_CLASS_CACHE.get(module_path)
+    if cached is not None:
+        return cached
     try:
-        agent_module = __import__(module_path, fromlist=["Agent"])  # type: ignore[arg-type]
-        return getattr(agent_module, "Agent")
+        agent_module = sys.modules.get(module_path) or __import__(module_path, fromlist=["Agent"])  # type: ignore[arg-type]
+        agent_class = getattr(agent_module, "Agent")
+        _AGENT_CLASS_CACHE[module_path] = agent_class
+        return agent_class
     except Exception as e:
         print(f"Error loading agent module {module_path}: {e}")
         raise
@@ -237,6 +247,7 @@ Agent = load_agent_class(CURRENT_AGENT_MODULE)
 # Get the correct state-store implementation  
 # ------------------------------------------------------------------  
 from utils import get_state_store  
+import ws_state
   
 STATE_STORE = get_state_store()  # either dict or CosmosDBStateStore  
   
@@ -245,12 +256,14 @@ STATE_STORE = get_state_store()  # either dict or CosmosDBStateStore
 # ------------------------------------------------------------------  
 app = FastAPI()
 
-# Add CORS middleware to handle preflight OPTIONS requests from React frontend
+# Add CORS middleware to handle preflight OPTIONS requests from React frontend.
+# Requests without an Origin header (APIM, server-to-server) and WebSocket
+# upgrades pass straight through. Auth is a bearer header, not cookies, so
+# credentialed CORS is not needed.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],  # React dev server
-    allow_credentials=True,
-    allow_methods=["*"],  # Allow all methods (GET, POST, OPTIONS, etc.)
+    allow_methods=["GET", "POST", "OPTIONS"],
     allow_headers=["*"],  # Allow all headers
 )
 
@@ -273,34 +286,64 @@ elif STATIC_DIR.exists():
 # ---------------------------------------------------------------
 class ConnectionManager:
     def __init__(self) -> None:
-        self.sessions: DefaultDict[str, Set[WebSocket]] = defaultdict(set)
+        # Copy-on-write tuples: connect/disconnect rebuild the tuple, so
+        # broadcast can iterate it directly without taking a snapshot.
+        self.sessions: dict[str, tuple[WebSocket, ...]] = {}
 
     async def connect(self, session_id: str, ws: WebSocket) -> None:
-        self.sessions[session_id].add(ws)
+        conns = self.sessions.get(session_id, ())
+        if ws not in conns:
+            self.sessions[session_id] = conns + (ws,)
 
     def disconnect(self, session_id: str, ws: WebSocket) -> None:
-        if session_id in self.sessions:
-            self.sessions[session_id].discard(ws)
-            if not self.sessions[session_id]:
-                self.sessions.pop(session_id, None)
+        conns = self.sessions.get(session_id)
+        if conns is None:
+            return
+        remaining = tuple(c for c in conns if c is not ws)
+        if remaining:
+            self.sessions[session_id] = remaining
+        else:
+            self.sessions.pop(session_id, None)
 
     async def broadcast(self, session_id: str, message: dict) -> None:
-        dead: list[WebSocket] = []
-        for ws in list(self.sessions.get(session_id, [])):
+        await self.broadcast_bytes(session_id, orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS))
+
+    async def broadcast_bytes(self, session_id: str, payload: bytes) -> None:
+        """Send an already-encoded JSON payload to every socket in the session."""
+        dead: Optional[list[WebSocket]] = None
+        for ws in self.sessions.get(session_id, ()):
             try:
-                await ws.send_json(message)
+                await ws.send_bytes(payload)
             except Exception:
+                if dead is None:
+                    dead = []
                 dead.append(ws)
-        for ws in dead:
-            self.disconnect(session_id, ws)
+        if dead:
+            for ws in dead:
+                self.disconnect(session_id, ws)
+
+
+async def send_json_fast(ws: WebSocket, message: dict) -> None:
+    """Send a JSON message as a binary frame, serialized with orjson."""
+    await ws.send_bytes(orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS))
+
+# Constant control events, encoded once at import
+_DONE_PAYLOAD = orjson.dumps({"type": "done"})
+_NO_STREAMING_PAYLOAD = orjson.dumps({"type": "error", "message": "Agent does not support streaming"})
+_MISSING_TOKEN_PAYLOAD = orjson.dumps({"type": "error", "message": "Missing access_token"})
+_MISSING_SESSION_PAYLOAD = orjson.dumps({"type": "error", "message": "Missing session_id"})
 
 MANAGER = ConnectionManager()
 
-# Make MANAGER globally accessible for background tasks
-import builtins
-builtins.GLOBAL_WS_MANAGER = MANAGER
+# Make MANAGER reachable from background tasks (see ws_state.py)
+ws_state.set_manager(MANAGER)
   
   
+# Routes whose handlers don't need the raw token share one verify_token
+# dependency instead of each declaring it as a parameter.
+authed = APIRouter(dependencies=[Depends(verify_token)])
+
+
 class ChatRequest(BaseModel):  
     session_id: str  
     prompt: str  
@@ -308,12 +351,12 @@ class ChatRequest(BaseModel):
   
 class ChatResponse(BaseModel):  
     response: str
-    tools_used: List[Dict[str, Any]] = []  # List of {name: str, args: dict}  
+    tools_used: list[dict[str, Any]] = []  # List of {name: str, args: dict}  
   
   
 class ConversationHistoryResponse(BaseModel):  
     session_id: str  
-    history: List[Dict[str, str]]  
+    history: list[dict[str, str]]  
   
   
 class SessionResetRequest(BaseModel):  
@@ -358,8 +401,8 @@ async def chat(req: ChatRequest, token: str = Depends(verify_token)):
     
     return ChatResponse(response=answer, tools_used=tools_used)  
   
-@app.post("/reset_session")  
-async def reset_session(req: SessionResetRequest, token: str = Depends(verify_token)):  
+@authed.post("/reset_session")  
+async def reset_session(req: SessionResetRequest):  
     if req.session_id in STATE_STORE:  
         del STATE_STORE[req.session_id]  
     hist_key = f"{req.session_id}_chat_history"  
@@ -367,8 +410,8 @@ async def reset_session(req: SessionResetRequest, token: str = Depends(verify_to
         del STATE_STORE[hist_key]
     return {"status": "success", "message": "Session reset successfully"}
 
-@app.get("/history/{session_id}", response_model=ConversationHistoryResponse)  
-async def get_conversation_history(session_id: str, token: str = Depends(verify_token)):  
+@authed.get("/history/{session_id}", response_model=ConversationHistoryResponse)  
+async def get_conversation_history(session_id: str):  
     history = STATE_STORE.get(f"{session_id}_chat_history", [])  
     return ConversationHistoryResponse(session_id=session_id, history=history)
 
@@ -381,14 +424,14 @@ class AgentInfo(BaseModel):
     description: str
 
 class AgentListResponse(BaseModel):
-    agents: List[AgentInfo]
+    agents: list[AgentInfo]
     current_agent: str
 
 class SetAgentRequest(BaseModel):
     module_path: str
 
-@app.get("/agents", response_model=AgentListResponse)
-async def list_agents(token: str = Depends(verify_token)):
+@authed.get("/agents", response_model=AgentListResponse)
+async def list_agents():
     """List all available agent modules and the currently active one."""
     agents = []
     for module_path in AVAILABLE_AGENTS:
@@ -416,8 +459,8 @@ async def list_agents(token: str = Depends(verify_token)):
         current_agent=CURRENT_AGENT_MODULE
     )
 
-@app.post("/agents/set")
-async def set_active_agent(req: SetAgentRequest, token: str = Depends(verify_token)):
+@authed.post("/agents/set")
+async def set_active_agent(req: SetAgentRequest):
     """Change the active agent module."""
     global CURRENT_AGENT_MODULE, Agent
     
@@ -447,6 +490,8 @@ async def set_active_agent(req: SetAgentRequest, token: str = Depends(verify_tok
             "message": "Failed to load agent."
         }
 
+app.include_router(authed)
+
 # ──────────────────────────────────────────────────────────────
 # Diagnostic: check observability status
 # ──────────────────────────────────────────────────────────────
@@ -454,7 +499,7 @@ async def set_active_agent(req: SetAgentRequest, token: str = Depends(verify_tok
 async def diagnostics_observability():
     """Check if observability is configured and working."""
     import importlib
-    diag: Dict[str, Any] = {
+    diag: dict[str, Any] = {
         "observability_enabled": _observability_enabled,
         "connection_string_set": bool(os.environ.get("APPLICATIONINSIGHTS_CONNECTION_STRING")),
     }
@@ -487,15 +532,16 @@ async def diagnostics_observability():
     return diag
 
 # ──────────────────────────────────────────────────────────────
-# Root route to serve React app
+# Root route: the React build is served by the "/" static mount at
+# the bottom of this file; without a build, return an API banner.
 # ──────────────────────────────────────────────────────────────
-@app.get("/")
-async def read_root():
-    """Serve the React frontend index.html"""
-    index_path = STATIC_DIR / "index.html"
-    if index_path.exists():
-        return FileResponse(str(index_path))
-    return {"message": "OpenAI Workshop Backend API", "version": "1.0.0"}
+INDEX_HTML = STATIC_DIR / "index.html"
+
+if not INDEX_HTML.exists():
+    @app.get("/")
+    async def read_root():
+        """API banner when no React build is bundled."""
+        return {"message": "OpenAI Workshop Backend API", "version": "1.0.0"}
 
 # ──────────────────────────────────────────────────────────────
 # NEW: WebSocket streaming endpoint
@@ -517,12 +563,12 @@ async def ws_chat(ws: WebSocket):
                 token = token or "dev-anon-token"
             else:
                 if not token:
-                    await ws.send_json({"type": "error", "message": "Missing access_token"})
+                    await ws.send_bytes(_MISSING_TOKEN_PAYLOAD)
                     continue
                 try:
                     _validate_jwt(token)
                 except HTTPException as exc:
-                    await ws.send_json({
+                    await send_json_fast(ws, {
                         "type": "error",
                         "message": exc.detail or "Unauthorized",
                         "status": exc.status_code,
@@ -530,12 +576,12 @@ async def ws_chat(ws: WebSocket):
                     continue
 
             if not session_id:
-                await ws.send_json({"type": "error", "message": "Missing session_id"})
+                await ws.send_bytes(_MISSING_SESSION_PAYLOAD)
                 continue
             if connected_session is None:
                 await MANAGER.connect(session_id, ws)
                 connected_session = session_id
-                await ws.send_json({"type": "info", "message": f"Registered session {session_id}"})
+                await send_json_fast(ws, {"type": "info", "message": f"Registered session {session_id}"})
 
             # If only registering (no prompt) continue
             if not prompt:
@@ -576,9 +622,9 @@ async def ws_chat(ws: WebSocket):
                         await MANAGER.broadcast(session_id, {"type": "final_result", "content": result})
                     # Else: events including final result are sent via streaming callback
                 else:
-                    await MANAGER.broadcast(session_id, {"type": "error", "message": "Agent does not support streaming"})
+                    await MANAGER.broadcast_bytes(session_id, _NO_STREAMING_PAYLOAD)
 
-                await MANAGER.broadcast(session_id, {"type": "done"})
+                await MANAGER.broadcast_bytes(session_id, _DONE_PAYLOAD)
             except Exception as e:
                 await MANAGER.broadcast(session_id, {"type": "error", "message": str(e)})
     except WebSocketDisconnect:
@@ -646,7 +692,13 @@ async def serialize_autogen_event(event: Any) -> Optional[dict]:
     except Exception:
         return None
 
-  
-  
+
+# Serve the React app (index.html at "/") via StaticFiles, which handles
+# stat caching, ETag/Last-Modified and 304s. Mounted last so it never
+# shadows the API and WebSocket routes above.
+if INDEX_HTML.exists():
+    app.mount("/", StaticFiles(directory=str(STATIC_DIR), html=True), name="spa")
+
+
 if __name__ == "__main__":  
     uvicorn.run(app, host="0.0.0.0", port=7000)
\ No newline at end of file
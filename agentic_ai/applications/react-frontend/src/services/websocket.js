@@ -1,5 +1,7 @@
 import { WS_URL, WS_RECONNECT_DELAY } from '../constants/index.js';
 
+const textDecoder = new TextDecoder();
+
 /**
  * WebSocket manager class to handle connection lifecycle
  */
@@ -29,6 +31,8 @@ export class WebSocketManager {
     this.intentionalClose = false; // Reset flag on new connection
 
     this.ws = new WebSocket(WS_URL);
+    // Backend sends orjson-encoded JSON as binary frames
+    this.ws.binaryType = 'arraybuffer';
 
     this.ws.onopen = () => {
       console.log('WebSocket connected');
@@ -40,7 +44,8 @@ export class WebSocketManager {
     };
 
     this.ws.onmessage = (event) => {
-      const data = JSON.parse(event.data);
+      const raw = typeof event.data === 'string' ? event.data : textDecoder.decode(event.data);
+      const data = JSON.parse(raw);
       if (this.onMessageCallback) {
         this.onMessageCallback(data);
       }
@@ -0,0 +1,22 @@
+"""
+Process-wide handle to the chat WebSocket ConnectionManager.
+
+backend.py registers its manager here at import time; background tasks that
+need to push events to a session read it from this module instead of going
+through ``builtins``::
+
+    import ws_state
+    await ws_state.MANAGER.broadcast(session_id, event)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+MANAGER: Optional[Any] = None
+
+
+def set_manager(manager: Any) -> None:
+    """Register the ConnectionManager used by this process."""
+    global MANAGER
+    MANAGER = manager
@@ -11,7 +11,8 @@ from .metrics import (
     ResponseQualityEvaluator,
     GroundedAccuracyEvaluator,
     EvaluationResult,
-    MetricType
+    MetricType,
+    load_jsonl,
 )
 
 __all__ = [
@@ -23,7 +24,8 @@ __all__ = [
     "ResponseQualityEvaluator",
     "GroundedAccuracyEvaluator",
     "EvaluationResult",
-    "MetricType"
+    "MetricType",
+    "load_jsonl",
 ]
 
 __version__ = "1.0.0"
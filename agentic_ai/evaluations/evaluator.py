@@ -6,10 +6,12 @@ Supports multi-turn conversations and Azure AI Foundry evaluators.
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from dataclasses import dataclass, asdict, field
 import sys
+from collections import Counter
 
 from metrics import (
     ToolBehaviorEvaluator,
@@ -18,11 +20,13 @@ from metrics import (
     GroundedAccuracyEvaluator,
     AzureAIEvaluatorSuite,
     EvaluationResult,
+    GraderCache,
     AZURE_EVALUATORS_AVAILABLE,
+    json_loads,
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentTrace:
     """Captured trace of agent execution."""
     query: str
@@ -31,7 +35,7 @@ class AgentTrace:
     metadata: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationTurn:
     """A single turn in a multi-turn conversation."""
     query: str
@@ -39,7 +43,7 @@ class ConversationTurn:
     tool_calls: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiTurnTrace:
     """Captured trace of a multi-turn conversation."""
     turns: List[ConversationTurn]
@@ -61,7 +65,7 @@ class MultiTurnTrace:
         return self.turns[0].query if self.turns else ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TestCaseResult:
     """Result of evaluating a single test case."""
     test_case_id: str
@@ -73,6 +77,7 @@ class TestCaseResult:
     timestamp: str
     is_multi_turn: bool = False
     turn_count: int = 1
+    category: str = ""
 
 
 class AgentEvaluationRunner:
@@ -111,6 +116,8 @@ class AgentEvaluationRunner:
         dataset_path: str = "eval_dataset.json",
         azure_openai_client=None,
         use_azure_evaluators: bool = True,
+        grader_cache_mode: str = "disabled",
+        combined_graders: bool = False,
     ):
         """
         Initialize evaluation runner.
@@ -119,6 +126,10 @@ class AgentEvaluationRunner:
             dataset_path: Path to evaluation dataset JSON
             azure_openai_client: Optional Azure OpenAI client for LLM-as-judge
             use_azure_evaluators: Whether to use Azure AI Foundry evaluators
+            grader_cache_mode: GraderCache mode for Azure grader outputs, stored
+                in eval_cache/graders.jsonl next to the dataset
+            combined_graders: Score intent, coherence, fluency and relevance
+                with one judge call instead of four Azure SDK evaluators
         """
         self.dataset_path = dataset_path
         self.test_cases = self._load_dataset()
@@ -133,14 +144,22 @@ class AgentEvaluationRunner:
         # Initialize Azure AI evaluators if available and enabled
         self.azure_evaluators = None
         if use_azure_evaluators and AZURE_EVALUATORS_AVAILABLE:
-            self.azure_evaluators = AzureAIEvaluatorSuite()
+            grader_cache = None
+            if grader_cache_mode != "disabled":
+                grader_cache = GraderCache(
+                    os.path.join(os.path.dirname(os.path.abspath(dataset_path)), "eval_cache", "graders.jsonl"),
+                    grader_cache_mode,
+                )
+            self.azure_evaluators = AzureAIEvaluatorSuite(
+                cache=grader_cache, combined_graders=combined_graders
+            )
             if not self.azure_evaluators.available:
                 self.azure_evaluators = None
     
     def _load_dataset(self) -> List[Dict[str, Any]]:
         """Load evaluation dataset from JSON."""
-        with open(self.dataset_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(self.dataset_path, 'rb') as f:
+            data = json_loads(f.read())
         return data.get("test_cases", [])
     
     def evaluate_agent_response(
@@ -248,31 +267,48 @@ class AgentEvaluationRunner:
             timestamp=datetime.now().isoformat(),
             is_multi_turn=is_multi_turn,
             turn_count=len(test_case.get("turns", [])) if is_multi_turn else 1,
+            category=test_case.get("category", ""),
         )
     
     def run_evaluation(
         self,
         agent_traces: List[AgentTrace],
-        output_dir: str = "eval_results"
+        output_dir: str = "eval_results",
+        max_workers: int = 4,
     ) -> Dict[str, Any]:
         """
         Run evaluation on all agent traces.
         
+        Test cases are scored in a thread pool since the LLM-as-judge
+        evaluators are blocking network calls; progress is printed as each
+        one finishes, while results keep the dataset order.
+        
+        Each result is also appended to eval_results_<timestamp>.jsonl as
+        soon as it is scored, so an interrupted run keeps what it finished.
+        
         Args:
             agent_traces: List of captured agent execution traces
             output_dir: Directory to save evaluation results
+            max_workers: Number of test cases to evaluate at once
             
         Returns:
             Summary of evaluation results
         """
         os.makedirs(output_dir, exist_ok=True)
         
-        results: List[TestCaseResult] = []
+        pairs: List[tuple] = []
+        
+        # Index traces once so each test case is matched with dict lookups
+        # (first trace wins, as with the former linear scan)
+        traces_by_id: Dict[str, AgentTrace] = {}
+        traces_by_query: Dict[str, AgentTrace] = {}
+        for trace in agent_traces:
+            traces_by_id.setdefault(trace.metadata.get("test_id"), trace)
+            traces_by_query.setdefault(trace.query.lower().strip(), trace)
         
         # Match traces to test cases
         for test_case in self.test_cases:
             # Find matching trace by test_id in metadata or by query
-            matching_trace = None
             test_id = test_case.get("id", "")
             
             # Get customer query - for multi-turn, use first turn's query
@@ -282,54 +318,80 @@ class AgentEvaluationRunner:
             else:
                 customer_query = test_case.get("customer_query", "")
             
-            for trace in agent_traces:
-                # Match by test_id in metadata first
-                if trace.metadata.get("test_id") == test_id:
-                    matching_trace = trace
-                    break
-                # Fallback to query matching
-                if customer_query and trace.query.lower().strip() == customer_query.lower().strip():
-                    matching_trace = trace
-                    break
+            # Match by test_id in metadata first, then fall back to the query
+            matching_trace = traces_by_id.get(test_id)
+            if matching_trace is None and customer_query:
+                matching_trace = traces_by_query.get(customer_query.lower().strip())
             
             if not matching_trace:
                 print(f"⚠ Warning: No trace found for test case {test_case['id']}")
                 continue
             
-            # Evaluate
-            result = self.evaluate_agent_response(test_case, matching_trace)
-            results.append(result)
-            
-            # Print progress
-            status = "✓ PASS" if result.passed else "✗ FAIL"
-            print(f"{status} {result.test_case_id}: {result.overall_score:.2f}")
+            pairs.append((test_case, matching_trace))
+        
+        # Evaluate
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        stream_file = os.path.join(output_dir, f"eval_results_{timestamp}.jsonl")
+        results: List[Optional[TestCaseResult]] = [None] * len(pairs)
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as pool, \
+                open(stream_file, 'w', encoding='utf-8') as stream:
+            futures = {
+                pool.submit(self.evaluate_agent_response, test_case, trace): index
+                for index, (test_case, trace) in enumerate(pairs)
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                results[futures[future]] = result
+                stream.write(json.dumps(self._result_to_dict(result)) + "\n")
+                stream.flush()
+                
+                # Print progress
+                status = "✓ PASS" if result.passed else "✗ FAIL"
+                print(f"{status} {result.test_case_id}: {result.overall_score:.2f}")
         
         # Generate summary
         summary = self._generate_summary(results)
         
         # Save results
-        self._save_results(results, summary, output_dir)
+        self._save_results(results, summary, output_dir, timestamp)
         
         return summary
     
     def _generate_summary(self, results: List[TestCaseResult]) -> Dict[str, Any]:
         """Generate summary statistics."""
         total = len(results)
-        passed = sum(1 for r in results if r.passed)
+        passed = 0
+        score_sum = 0.0
         
-        avg_score = sum(r.overall_score for r in results) / total if total > 0 else 0.0
-        
-        # Metric breakdowns
-        metric_scores = {}
+        # Single pass: running sums per metric instead of per-metric score lists
+        metric_totals: Dict[str, List[float]] = {}
+        category_total: Counter = Counter()
+        category_passed: Counter = Counter()
         for result in results:
+            passed += result.passed
+            score_sum += result.overall_score
+            category_total[result.category] += 1
+            if result.passed:
+                category_passed[result.category] += 1
             for metric in result.metrics:
-                if metric.metric_name not in metric_scores:
-                    metric_scores[metric.metric_name] = []
-                metric_scores[metric.metric_name].append(metric.score)
+                totals = metric_totals.get(metric.metric_name)
+                if totals is None:
+                    totals = metric_totals[metric.metric_name] = [0.0, 0]
+                totals[0] += metric.score
+                totals[1] += 1
         
+        avg_score = score_sum / total if total > 0 else 0.0
         metric_averages = {
-            name: sum(scores) / len(scores) if scores else 0.0
-            for name, scores in metric_scores.items()
+            name: score / count
+            for name, (score, count) in metric_totals.items()
+        }
+        category_breakdown = {
+            category: {
+                "total": count,
+                "passed": category_passed[category],
+                "pass_rate": category_passed[category] / count,
+            }
+            for category, count in category_total.items()
         }
         
         return {
@@ -339,17 +401,19 @@ class AgentEvaluationRunner:
             "failed": total - passed,
             "pass_rate": passed / total if total > 0 else 0.0,
             "average_score": avg_score,
-            "metric_averages": metric_averages
+            "metric_averages": metric_averages,
+            "category_breakdown": category_breakdown,
         }
     
     def _save_results(
         self,
         results: List[TestCaseResult],
         summary: Dict[str, Any],
-        output_dir: str
+        output_dir: str,
+        timestamp: Optional[str] = None,
     ):
         """Save evaluation results to files."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Save detailed results
         results_file = os.path.join(output_dir, f"eval_results_{timestamp}.json")
@@ -371,6 +435,7 @@ class AgentEvaluationRunner:
         """Convert TestCaseResult to dictionary."""
         return {
             "test_case_id": result.test_case_id,
+            "category": result.category,
             "query": result.query,
             "agent_response": result.agent_response,
             "overall_score": result.overall_score,
@@ -412,6 +477,14 @@ class AgentEvaluationRunner:
         for metric, avg in summary['metric_averages'].items():
             lines.append(f"{metric:30s}: {avg:.2f}")
         
+        lines.append("\n" + "=" * 80)
+        lines.append("CATEGORY BREAKDOWN")
+        lines.append("=" * 80)
+        for category, stats in sorted(summary['category_breakdown'].items()):
+            lines.append(
+                f"{category or '(none)':30s}: {stats['passed']}/{stats['total']} passed ({stats['pass_rate']:.0%})"
+            )
+        
         lines.append("\n" + "=" * 80)
         lines.append("DETAILED RESULTS")
         lines.append("=" * 80)
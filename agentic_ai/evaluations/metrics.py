@@ -9,12 +9,29 @@ Pattern-agnostic metrics that work across:
 Includes Azure AI Foundry evaluators for LLM-as-judge evaluation.
 """
 
+import hashlib
+import json
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+# orjson (optional - the CI eval job installs a minimal dependency set)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# openai (optional - only the LLM judges need it; used to recognise throttling)
+try:
+    from openai import RateLimitError
+except ImportError:
+    RateLimitError = None
+
 # Azure AI Foundry Evaluators (optional - graceful degradation if not available)
 try:
     from azure.ai.evaluation import (
@@ -59,7 +76,7 @@ class MetricType(Enum):
 # Result Container
 # =========================
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
     metric_name: str
     metric_type: MetricType
@@ -159,7 +176,7 @@ class CompletenessEvaluator:
         tool_calls: List[Dict[str, Any]],
     ) -> EvaluationResult:
 
-        tool_names = [c.get("name", "") for c in tool_calls]
+        tool_names = {c.get("name", "") for c in tool_calls}
         results = {}
 
         for criterion, required in success_criteria.items():
@@ -397,10 +414,18 @@ class SafetyEvaluator:
         "I have removed the charge",
     ]
 
+    # One case-insensitive pass over the response instead of lowercasing it
+    # and scanning once per pattern.
+    _RISKY_RE = re.compile(
+        "|".join(re.escape(p) for p in RISKY_PATTERNS), re.IGNORECASE
+    )
+    # Lowercased once here rather than per pattern on every response.
+    _RISKY_BY_LOWER = {p.lower(): p for p in RISKY_PATTERNS}
+
     def evaluate(self, response: str) -> EvaluationResult:
 
-        lower = response.lower()
-        hits = [p for p in self.RISKY_PATTERNS if p in lower]
+        found = {m.lower() for m in self._RISKY_RE.findall(response)}
+        hits = [p for low, p in self._RISKY_BY_LOWER.items() if low in found]
 
         safe = len(hits) == 0
         score = 5.0 if safe else 1.0  # 5/5 for safe, 1/5 for risky
@@ -433,6 +458,76 @@ def _safe_float(value: Any, default: float = 0.0) -> float:
     return default
 
 
+def load_jsonl(path: str) -> List[Dict[str, Any]]:
+    """Read a JSONL file in a single read and parse each non-blank line."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    return [json_loads(line) for line in raw.splitlines() if line.strip()]
+
+
+GRADER_CACHE_MODES = ("disabled", "enabled", "read-only", "write-only", "replay")
+
+
+class GraderCache:
+    """
+    JSONL-backed cache of raw LLM grader outputs.
+    
+    Keyed by SHA256 over (grader name, model deployment, grader inputs), so
+    re-scoring the same responses after a threshold or weighting change does
+    not call the graders again. Modes:
+    - disabled: never read or write
+    - enabled: return cached outputs, record misses
+    - read-only: return cached outputs, never record
+    - write-only: always call the grader, record every output
+    - replay: only cached outputs; a miss raises LookupError
+    """
+
+    def __init__(self, path: str, mode: str = "disabled"):
+        self.path = path
+        self.mode = mode
+        self._reads = mode in ("enabled", "read-only", "replay")
+        self._writes = mode in ("enabled", "write-only")
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()  # graders run in worker threads
+        
+        if self._reads and os.path.exists(path):
+            for entry in load_jsonl(path):
+                self._entries[entry["key"]] = entry["result"]
+
+    @staticmethod
+    def key(name: str, deployment: str, inputs: Dict[str, Any]) -> str:
+        payload = json.dumps([name, deployment, inputs], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self._reads:
+            return None
+        result = self._entries.get(key)
+        if result is None and self.mode == "replay":
+            raise LookupError(f"No cached grader output for key {key[:12]} (replay mode)")
+        return result
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        if not self._writes:
+            return
+        line = json.dumps({"key": key, "result": result}, default=str) + "\n"
+        with self._lock:
+            self._entries[key] = result
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """True for throttling errors from the OpenAI client or the Azure evaluation SDK."""
+    if RateLimitError is not None and isinstance(error, RateLimitError):
+        return True
+    if getattr(error, "status_code", None) == 429:
+        return True
+    # Fallback: the evaluation SDK wraps the underlying OpenAI error in its own exception
+    return "rate limit" in str(error).lower()
+
+
 class AzureAIEvaluatorSuite:
     """
     Wrapper for Azure AI Foundry evaluation SDK evaluators.
@@ -635,7 +730,14 @@ class AzureAIEvaluatorSuite:
         }
     ]
 
-    def __init__(self, model_config: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        model_config: Optional[Dict[str, Any]] = None,
+        cache: Optional[GraderCache] = None,
+        combined_graders: bool = False,
+        max_concurrent_graders: int = 8,
+        max_retries: int = 5,
+    ):
         """
         Initialize Azure AI evaluators.
         
@@ -645,9 +747,25 @@ class AzureAIEvaluatorSuite:
                 - api_key: API key (optional if using DefaultAzureCredential)
                 - azure_deployment: Model deployment name
                 - api_version: API version
+            cache: Optional GraderCache for reusing grader outputs across runs
+            combined_graders: Score intent, coherence, fluency and relevance
+                with one judge call per response instead of four SDK calls
+            max_concurrent_graders: Grader calls allowed in flight at once
+                across all test cases, to stay within the deployment's rate limit
+            max_retries: Retries with exponential backoff on 429 responses
         """
         self.available = AZURE_EVALUATORS_AVAILABLE
         self._evaluators_initialized = False
+        self._cache = cache
+        self._combined_graders = combined_graders
+        self._grader_slots = threading.BoundedSemaphore(max(max_concurrent_graders, 1))
+        self._max_retries = max_retries
+        self._deployment = ""
+        self._model_config: Dict[str, Any] = {}
+        self._solution_client = None
+        self._solution_client_lock = threading.Lock()
+        self._judge_client = None
+        self._judge_client_lock = threading.Lock()
         
         if not self.available:
             print("[WARN] Azure AI Evaluation SDK not available - using fallback metrics")
@@ -675,6 +793,8 @@ class AzureAIEvaluatorSuite:
         # Detect reasoning models (GPT-5+, o-series) which require
         # max_completion_tokens instead of max_tokens.
         deployment = model_config.get("azure_deployment", "")
+        self._deployment = deployment
+        self._model_config = model_config
         self._is_reasoning_model = self._check_reasoning_model(deployment)
         if self._is_reasoning_model:
             print(f"[OK] Reasoning model detected ({deployment}) — passing is_reasoning_model=True to evaluators")
@@ -714,13 +834,39 @@ class AzureAIEvaluatorSuite:
             return True
         return False
 
+    def _call_grader(self, grader, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a grader within the concurrency limit, backing off on 429s.
+        
+        The slot is released while sleeping so throttled calls don't hold up
+        graders for other test cases.
+        """
+        for attempt in range(self._max_retries + 1):
+            try:
+                with self._grader_slots:
+                    return grader(**inputs)
+            except Exception as e:
+                if attempt == self._max_retries or not _is_rate_limited(e):
+                    raise
+                time.sleep(min(60, 2 ** attempt))
+
+    def _grade(self, name: str, grader, **inputs) -> Dict[str, Any]:
+        """Call a grader, going through the grader cache when one is set."""
+        if self._cache is None:
+            return self._call_grader(grader, inputs)
+        key = self._cache.key(name, self._deployment, inputs)
+        result = self._cache.get(key)
+        if result is None:
+            result = self._call_grader(grader, inputs)
+            self._cache.put(key, result)
+        return result
+
     def evaluate_intent(self, query: str, response: str) -> EvaluationResult:
         """Evaluate if agent correctly identified user intent."""
         if not self.available or not self._evaluators_initialized:
             return self._fallback_result("intent_resolution", MetricType.INTENT)
         
         try:
-            result = self._intent_evaluator(query=query, response=response)
+            result = self._grade("intent_resolution", self._intent_evaluator, query=query, response=response)
             score = _safe_float(result.get("intent_resolution", 0))  # Keep 1-5 scale
             return EvaluationResult(
                 metric_name="intent_resolution",
@@ -739,7 +885,7 @@ class AzureAIEvaluatorSuite:
             return self._fallback_result("coherence", MetricType.COHERENCE)
         
         try:
-            result = self._coherence_evaluator(query=query, response=response)
+            result = self._grade("coherence", self._coherence_evaluator, query=query, response=response)
             score = _safe_float(result.get("coherence", 0))  # Keep 1-5 scale
             return EvaluationResult(
                 metric_name="coherence",
@@ -758,7 +904,7 @@ class AzureAIEvaluatorSuite:
             return self._fallback_result("fluency", MetricType.FLUENCY)
         
         try:
-            result = self._fluency_evaluator(query=query, response=response)
+            result = self._grade("fluency", self._fluency_evaluator, query=query, response=response)
             score = _safe_float(result.get("fluency", 0))  # Keep 1-5 scale
             return EvaluationResult(
                 metric_name="fluency",
@@ -777,7 +923,7 @@ class AzureAIEvaluatorSuite:
             return self._fallback_result("relevance", MetricType.RELEVANCE)
         
         try:
-            result = self._relevance_evaluator(query=query, response=response)
+            result = self._grade("relevance", self._relevance_evaluator, query=query, response=response)
             score = _safe_float(result.get("relevance", 0))  # Keep 1-5 scale
             return EvaluationResult(
                 metric_name="relevance",
@@ -790,6 +936,77 @@ class AzureAIEvaluatorSuite:
         except Exception as e:
             return self._fallback_result("relevance", MetricType.RELEVANCE, str(e))
 
+    # Metrics scored together by evaluate_combined, in evaluate_all order
+    COMBINED_METRICS = (
+        ("intent_resolution", MetricType.INTENT),
+        ("coherence", MetricType.COHERENCE),
+        ("fluency", MetricType.FLUENCY),
+        ("relevance", MetricType.RELEVANCE),
+    )
+
+    def evaluate_combined(self, query: str, response: str) -> List[EvaluationResult]:
+        """
+        Score intent resolution, coherence, fluency and relevance in one call.
+        
+        A single JSON-mode judge prompt replaces the four SDK evaluators, which
+        cuts grader calls and tokens per response by roughly 4x. Scores use the
+        same 1-5 scale and threshold, but come from this prompt rather than the
+        SDK's, so they can drift slightly from the Foundry portal numbers.
+        """
+        if not self.available or not self._evaluators_initialized:
+            return [self._fallback_result(name, metric_type) for name, metric_type in self.COMBINED_METRICS]
+        
+        names = ", ".join(name for name, _ in self.COMBINED_METRICS)
+        prompt = f"""You are evaluating a customer service agent's response.
+
+USER QUERY:
+{query}
+
+AGENT RESPONSE:
+{response}
+
+Score the response from 1-5 on each of these dimensions:
+- intent_resolution: did the agent identify and resolve what the user wanted?
+- coherence: is the response logically organised and easy to follow?
+- fluency: is the response well-written and grammatically correct?
+- relevance: does the response address the query without going off-topic?
+
+Return JSON with one entry per dimension ({names}), each of the form
+{{"score": <1-5>, "reason": "<brief explanation>"}}
+"""
+        
+        try:
+            client = self._get_judge_client()
+            
+            def judge(prompt: str, model: str) -> Dict[str, Any]:
+                result = client.chat.completions.create(
+                    model=model,
+                    messages=[{"role": "user", "content": prompt}],
+                    response_format={"type": "json_object"},
+                )
+                return json.loads(result.choices[0].message.content)
+            
+            data = self._grade("combined_quality", judge, prompt=prompt, model=self._deployment)
+        except Exception as e:
+            return [self._fallback_result(name, metric_type, str(e)) for name, metric_type in self.COMBINED_METRICS]
+        
+        results = []
+        for name, metric_type in self.COMBINED_METRICS:
+            entry = data.get(name)
+            if not isinstance(entry, dict):
+                results.append(self._fallback_result(name, metric_type, f"No {name} score in judge output"))
+                continue
+            score = _safe_float(entry.get("score", 3))  # Keep 1-5 scale
+            results.append(EvaluationResult(
+                metric_name=name,
+                metric_type=metric_type,
+                score=score,
+                passed=score >= 3.0,  # Threshold: 3/5
+                details=entry,
+                explanation=entry.get("reason", ""),
+            ))
+        return results
+
     def evaluate_tool_call_accuracy(
         self,
         query: str,
@@ -862,7 +1079,9 @@ class AzureAIEvaluatorSuite:
                 })
             
             # Call the evaluator
-            result = self._tool_call_accuracy_evaluator(
+            result = self._grade(
+                "tool_call_accuracy",
+                self._tool_call_accuracy_evaluator,
                 query=query,
                 response=response,
                 tool_calls=formatted_tool_calls,
@@ -974,7 +1193,9 @@ You must:
             response_messages.append({"role": "assistant", "content": response})
             
             # Call the evaluator
-            result = self._task_adherence_evaluator(
+            result = self._grade(
+                "task_adherence",
+                self._task_adherence_evaluator,
                 query=query_messages,
                 response=response_messages,
                 task=task_description,
@@ -1044,25 +1265,20 @@ Return JSON: {{"score": <1-5>, "reason": "<brief explanation>"}}
 """
         
         try:
-            # Use provided client or create one from environment
-            if llm_client:
-                client = llm_client
-            else:
-                from openai import AzureOpenAI
-                client = AzureOpenAI(
-                    azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-                    api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-                    api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-12-01-preview"),
-                )
+            # Use provided client or the suite's shared one from environment
+            client = llm_client or self._get_solution_client()
             
-            result = client.chat.completions.create(
-                model=os.getenv("AZURE_OPENAI_CHAT_DEPLOYMENT", "gpt-4o-mini"),
-                messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_object"},
-            )
+            model = os.getenv("AZURE_OPENAI_CHAT_DEPLOYMENT", "gpt-4o-mini")
             
-            import json
-            data = json.loads(result.choices[0].message.content)
+            def judge(prompt: str, model: str) -> Dict[str, Any]:
+                result = client.chat.completions.create(
+                    model=model,
+                    messages=[{"role": "user", "content": prompt}],
+                    response_format={"type": "json_object"},
+                )
+                return json.loads(result.choices[0].message.content)
+            
+            data = self._grade("solution_accuracy", judge, prompt=prompt, model=model)
             score = _safe_float(data.get("score", 3))  # Keep 1-5 scale
             
             return EvaluationResult(
@@ -1076,6 +1292,46 @@ Return JSON: {{"score": <1-5>, "reason": "<brief explanation>"}}
         except Exception as e:
             return self._fallback_result("solution_accuracy", MetricType.SOLUTION_ACCURACY, str(e))
 
+    def _get_solution_client(self):
+        """Create the AzureOpenAI client for solution accuracy once and reuse it.
+        
+        Graders run in worker threads, so creation is guarded by a lock.
+        """
+        with self._solution_client_lock:
+            if self._solution_client is None:
+                from openai import AzureOpenAI
+                self._solution_client = AzureOpenAI(
+                    azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+                    api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+                    api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-12-01-preview"),
+                )
+            return self._solution_client
+
+    def _get_judge_client(self):
+        """Create the AzureOpenAI client for evaluate_combined once and reuse it.
+        
+        Built from the same model_config as the SDK evaluators, so the judge
+        call reaches the endpoint that serves self._deployment. Without an
+        api_key it authenticates with DefaultAzureCredential, like the SDK.
+        """
+        with self._judge_client_lock:
+            if self._judge_client is None:
+                from openai import AzureOpenAI
+                config = self._model_config
+                client_kwargs = {
+                    "azure_endpoint": config["azure_endpoint"],
+                    "api_version": config.get("api_version", "2024-12-01-preview"),
+                }
+                if config.get("api_key"):
+                    client_kwargs["api_key"] = config["api_key"]
+                else:
+                    from azure.identity import DefaultAzureCredential, get_bearer_token_provider
+                    client_kwargs["azure_ad_token_provider"] = get_bearer_token_provider(
+                        DefaultAzureCredential(), "https://cognitiveservices.azure.com/.default"
+                    )
+                self._judge_client = AzureOpenAI(**client_kwargs)
+            return self._judge_client
+
     def evaluate_all(
         self,
         query: str,
@@ -1094,32 +1350,48 @@ Return JSON: {{"score": <1-5>, "reason": "<brief explanation>"}}
             scoring_rubric: Rubric for scoring (optional)
             tool_calls: List of tool calls made by agent (optional)
             llm_client: OpenAI client for solution accuracy (optional)
+        
+        Each evaluator is a separate blocking LLM call, so they run
+        concurrently in a thread pool; results keep the order listed here.
         """
-        results = [
-            self.evaluate_intent(query, response),
-            self.evaluate_coherence(query, response),
-            self.evaluate_fluency(query, response),
-            self.evaluate_relevance(query, response),
-        ]
+        if self._combined_graders:
+            calls = [(self.evaluate_combined, (query, response))]
+        else:
+            calls = [
+                (self.evaluate_intent, (query, response)),
+                (self.evaluate_coherence, (query, response)),
+                (self.evaluate_fluency, (query, response)),
+                (self.evaluate_relevance, (query, response)),
+            ]
         
         # Add tool call accuracy if tool calls were made
         if tool_calls:
-            results.append(
-                self.evaluate_tool_call_accuracy(query, response, tool_calls)
+            calls.append(
+                (self.evaluate_tool_call_accuracy, (query, response, tool_calls))
             )
             # Also evaluate task adherence (complementary to solution_accuracy)
-            results.append(
-                self.evaluate_task_adherence(query, response, tool_calls)
+            calls.append(
+                (self.evaluate_task_adherence, (query, response, tool_calls))
             )
         
         if ground_truth and scoring_rubric:
-            results.append(
-                self.evaluate_solution_accuracy(
-                    query, response, ground_truth, scoring_rubric, llm_client
-                )
+            calls.append(
+                (self.evaluate_solution_accuracy,
+                 (query, response, ground_truth, scoring_rubric, llm_client))
             )
         
-        return results
+        # Every evaluate_* method catches its own errors and returns a
+        # fallback result, so one failing grader doesn't affect the others.
+        with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+            futures = [pool.submit(fn, *args) for fn, args in calls]
+            results: List[EvaluationResult] = []
+            for future in futures:
+                result = future.result()
+                if isinstance(result, list):
+                    results.extend(result)  # evaluate_combined
+                else:
+                    results.append(result)
+            return results
 
     def _fallback_result(
         self,
@@ -19,10 +19,12 @@ Prerequisites:
 import os
 import sys
 import asyncio
+import hashlib
 import json
 import warnings
 import logging
 import uuid
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
@@ -71,7 +73,7 @@ print("AI AGENT EVALUATION - Using Agent from .env")
 print("=" * 80)
 
 # Import evaluation framework
-from evaluations import AgentEvaluationRunner, AgentTrace
+from evaluations import AgentEvaluationRunner, AgentTrace, load_jsonl
 
 
 class ToolCallTracker:
@@ -94,6 +96,80 @@ class ToolCallTracker:
                 self.tool_calls.append({"name": tool_name})
 
 
+CACHE_MODES = ("disabled", "enabled", "read-only", "write-only", "replay")
+
+
+class ResponseCache:
+    """JSONL-backed cache of agent traces, keyed by agent and test case inputs.
+
+    Lets metric/threshold iteration re-score earlier agent responses without
+    calling the backend again. Modes:
+        disabled   - never read or write (default)
+        enabled    - return cached traces, record misses
+        read-only  - return cached traces, never record
+        write-only - always call the backend, record every trace
+        replay     - only cached traces; a miss is an error
+
+    Traces that ended in an error are never recorded.
+    """
+
+    def __init__(self, path: Path, mode: str = "disabled") -> None:
+        self.path = path
+        self.mode = mode
+        self._reads = mode in ("enabled", "read-only", "replay")
+        self._writes = mode in ("enabled", "write-only")
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+        if self._reads and path.exists():
+            for entry in load_jsonl(str(path)):
+                self._entries[entry["key"]] = entry["trace"]
+
+    @staticmethod
+    def key(agent_name: str, backend_url: str, test_case: Dict[str, Any]) -> str:
+        """SHA256 over everything that determines what the backend is asked."""
+        inputs = {
+            "customer_id": test_case.get("customer_id"),
+            "customer_query": test_case.get("customer_query"),
+            "turns": [turn.get("customer_query") for turn in test_case.get("turns", [])],
+        }
+        payload = json.dumps([agent_name, backend_url, inputs], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> AgentTrace | None:
+        if not self._reads:
+            return None
+        trace = self._entries.get(key)
+        if trace is None:
+            if self.mode == "replay":
+                raise LookupError(
+                    f"No cached response for key {key[:12]} in {self.path} (--cache-mode replay)"
+                )
+            return None
+        return AgentTrace(
+            query=trace["query"],
+            response=trace["response"],
+            tool_calls=trace["tool_calls"],
+            metadata={**trace["metadata"], "from_cache": True},
+        )
+
+    def put(self, key: str, trace: AgentTrace) -> None:
+        if not self._writes or _is_error_trace(trace):
+            return
+        entry = asdict(trace)
+        self._entries[key] = entry
+        # Appends happen on the event loop thread, one line at a time.
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"key": key, "trace": entry}) + "\n")
+
+
+def _is_error_trace(trace: AgentTrace) -> bool:
+    if "error" in trace.metadata:
+        return True
+    responses = trace.metadata.get("turn_responses", [trace.response])
+    return any(r.startswith("Error: ") for r in responses)
+
+
 async def run_agent_on_query(agent_instance, query: str, session_id: str) -> tuple[str, List[Dict[str, Any]]]:
     """Run the agent on a single query and capture response + tool calls.
 
@@ -149,6 +225,156 @@ async def run_agent_on_query(agent_instance, query: str, session_id: str) -> tup
     return response_text, captured_tools
 
 
+def _preview(text: str, limit: int) -> str:
+    """Shorten text for progress output, slicing only when it is too long."""
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "..."
+
+
+async def run_test_case(
+    client,
+    test_case: Dict[str, Any],
+    label: str,
+    backend_url: str,
+    agent_name: str,
+) -> AgentTrace:
+    """Send one test case (single- or multi-turn) to the backend and capture its trace.
+
+    Turns of a multi-turn case are sent in order on the same session; separate
+    test cases use separate sessions, so they can run concurrently.
+    """
+    test_id = test_case["id"]
+    is_multi_turn = test_case.get("multi_turn", False)
+    customer_id = test_case.get("customer_id")
+
+    if is_multi_turn:
+        # Handle multi-turn conversation
+        turns = test_case.get("turns", [])
+        print(f"{label} {test_id} [MULTI-TURN: {len(turns)} turns]")
+
+        # Use unique session ID to avoid cached conversation context
+        session_id = f"{agent_name}_eval_{test_id}_{uuid.uuid4().hex}"
+        all_responses = []
+        all_tool_calls = []
+
+        for turn_num, turn in enumerate(turns, 1):
+            turn_query = turn["customer_query"]
+
+            # Add customer ID to first turn if not present
+            if turn_num == 1 and customer_id and f"customer {customer_id}" not in turn_query.lower():
+                turn_query = f"I'm customer {customer_id}. {turn_query}"
+
+            print(f"  {test_id} turn {turn_num}: {_preview(turn_query, 60)}")
+
+            try:
+                response_obj = await client.post(
+                    f"{backend_url}/chat",
+                    json={"prompt": turn_query, "session_id": session_id},
+                    timeout=60.0
+                )
+                response_obj.raise_for_status()
+
+                result = response_obj.json()
+                response = result.get("response", "")
+                tools_used = result.get("tools_used", [])
+
+                all_responses.append(response)
+                # Handle both old format (list of strings) and new format (list of dicts)
+                for t in (tools_used or []):
+                    if isinstance(t, dict):
+                        all_tool_calls.append(t)
+                    else:
+                        all_tool_calls.append({"name": t, "args": {}})
+
+                print(f"    → {test_id} turn {turn_num}: {_preview(response, 60)} | Tools: {len(tools_used or [])}")
+
+            except Exception as e:
+                print(f"    ❌ {test_id} error in turn {turn_num}: {e}")
+                all_responses.append(f"Error: {str(e)}")
+
+        # Create combined trace for multi-turn
+        return AgentTrace(
+            query=test_case.get("customer_query", turns[0]["customer_query"] if turns else ""),
+            response="\n\n---\n\n".join(all_responses),
+            tool_calls=all_tool_calls,
+            metadata={
+                "test_id": test_id,
+                "agent_backend": backend_url,
+                "session_id": session_id,
+                "is_multi_turn": True,
+                "turn_count": len(turns),
+                "turn_responses": all_responses,
+            }
+        )
+
+    # Handle single-turn conversation (original logic)
+    query = test_case["customer_query"]
+
+    # Augment query with customer ID if available
+    if customer_id and f"customer {customer_id}" not in query.lower():
+        query = f"I'm customer {customer_id}. {query}"
+
+    print(f"{label} {test_id}: {_preview(query, 80)}")
+
+    # Use unique session ID to avoid cached conversation context
+    session_id = f"{agent_name}_eval_{test_id}_{uuid.uuid4().hex}"
+
+    try:
+        request_data = {
+            "prompt": query,
+            "session_id": session_id
+        }
+
+        response_obj = await client.post(
+            f"{backend_url}/chat",
+            json=request_data,
+            timeout=60.0
+        )
+        response_obj.raise_for_status()
+
+        result = response_obj.json()
+        response = result.get("response", "")
+        tools_used = result.get("tools_used", [])
+
+        # Handle both old format (list of strings) and new format (list of dicts)
+        tool_calls = []
+        for t in (tools_used or []):
+            if isinstance(t, dict):
+                tool_calls.append(t)
+            else:
+                tool_calls.append({"name": t, "args": {}})
+
+        print(f"  ✓ {test_id}: {_preview(response, 100)} | Tools called: {len(tool_calls)}")
+
+        return AgentTrace(
+            query=test_case["customer_query"],
+            response=response,
+            tool_calls=tool_calls,
+            metadata={
+                "test_id": test_id,
+                "agent_backend": backend_url,
+                "session_id": session_id,
+                "augmented_query": query,
+                "is_multi_turn": False,
+            }
+        )
+
+    except Exception as e:
+        print(f"  ❌ {test_id} error: {e}")
+        return AgentTrace(
+            query=query,
+            response=f"Error: {str(e)}",
+            tool_calls=[],
+            metadata={
+                "test_id": test_id,
+                "agent_backend": backend_url,
+                "error": str(e),
+                "is_multi_turn": False,
+            }
+        )
+
+
 def format_trace_as_agent_messages(trace: AgentTrace) -> tuple[list, list]:
     """Convert an AgentTrace to the agent message schema expected by Foundry evaluators.
     
@@ -548,7 +774,7 @@ Evaluate how well the agent's response matches the expected solution. Consider:
                                             'score': score,
                                             'label': label,
                                             'threshold': threshold,
-                                            'reason': reason[:100] + '...' if reason and len(reason) > 100 else reason
+                                            'reason': _preview(reason, 100) if reason else reason
                                         })
                         
                         # Print aggregated scores - keep 1-5 scale for portal parity
@@ -610,6 +836,11 @@ async def main():
     parser.add_argument("--multi-turn-only", action="store_true", help="Only run multi-turn test cases")
     parser.add_argument("--single-turn-only", action="store_true", help="Only run single-turn test cases")
     parser.add_argument("--ci", action="store_true", help="CI mode: skip interactive prompts, auto-continue on MCP unavailability")
+    parser.add_argument("--concurrency", type=int, default=4, help="Number of test cases to run against the backend at once (1 = sequential)")
+    parser.add_argument("--cache-mode", choices=CACHE_MODES, default="disabled",
+                        help="Reuse recorded agent responses and grader outputs from eval_cache/ (default: disabled)")
+    parser.add_argument("--combined-graders", action="store_true",
+                        help="Score intent/coherence/fluency/relevance with one judge call per response instead of four SDK evaluators")
     args = parser.parse_args()
     
     # Determine agent name based on --agent flag
@@ -695,156 +926,35 @@ async def main():
     print(f"   - Multi-turn: {multi_turn_count}")
     
     # 5. Run each test case
-    traces = []
-    
     print(f"\n{'=' * 80}")
     print(f"RUNNING AGENT ON TEST CASES")
     print(f"{'=' * 80}\n")
     
-    for i, test_case in enumerate(test_cases, 1):
-        test_id = test_case["id"]
-        is_multi_turn = test_case.get("multi_turn", False)
-        customer_id = test_case.get("customer_id")
-        
-        if is_multi_turn:
-            # Handle multi-turn conversation
-            turns = test_case.get("turns", [])
-            print(f"[{i}/{len(test_cases)}] {test_id} [MULTI-TURN: {len(turns)} turns]")
-            
-            # Use unique session ID to avoid cached conversation context
-            session_id = f"{agent_name}_eval_{test_id}_{uuid.uuid4().hex[:8]}"
-            all_responses = []
-            all_tool_calls = []
-            
-            for turn_num, turn in enumerate(turns, 1):
-                turn_query = turn["customer_query"]
-                
-                # Add customer ID to first turn if not present
-                if turn_num == 1 and customer_id and f"customer {customer_id}" not in turn_query.lower():
-                    turn_query = f"I'm customer {customer_id}. {turn_query}"
-                
-                print(f"  Turn {turn_num}: {turn_query[:60]}...")
-                
-                try:
-                    import httpx
-                    
-                    async with httpx.AsyncClient() as client:
-                        response_obj = await client.post(
-                            f"{backend_url}/chat",
-                            json={"prompt": turn_query, "session_id": session_id},
-                            timeout=60.0
-                        )
-                        response_obj.raise_for_status()
-                        
-                        result = response_obj.json()
-                        response = result.get("response", "")
-                        tools_used = result.get("tools_used", [])
-                        
-                        all_responses.append(response)
-                        # Handle both old format (list of strings) and new format (list of dicts)
-                        for t in (tools_used or []):
-                            if isinstance(t, dict):
-                                all_tool_calls.append(t)
-                            else:
-                                all_tool_calls.append({"name": t, "args": {}})
-                        
-                        print(f"    → Response: {response[:60]}... | Tools: {len(tools_used or [])}")
-                        
-                except Exception as e:
-                    print(f"    ❌ Error in turn {turn_num}: {e}")
-                    all_responses.append(f"Error: {str(e)}")
-            
-            # Create combined trace for multi-turn
-            trace = AgentTrace(
-                query=test_case.get("customer_query", turns[0]["customer_query"] if turns else ""),
-                response="\n\n---\n\n".join(all_responses),
-                tool_calls=all_tool_calls,
-                metadata={
-                    "test_id": test_id,
-                    "agent_backend": backend_url,
-                    "session_id": session_id,
-                    "is_multi_turn": True,
-                    "turn_count": len(turns),
-                    "turn_responses": all_responses,
-                }
-            )
-            traces.append(trace)
-            
-        else:
-            # Handle single-turn conversation (original logic)
-            query = test_case["customer_query"]
-            
-            # Augment query with customer ID if available
-            if customer_id and f"customer {customer_id}" not in query.lower():
-                query = f"I'm customer {customer_id}. {query}"
-            
-            print(f"[{i}/{len(test_cases)}] {test_id}")
-            print(f"Query: {query[:80]}...")
-            
-            # Use unique session ID to avoid cached conversation context
-            session_id = f"{agent_name}_eval_{test_id}_{uuid.uuid4().hex[:8]}"
-            
-            try:
-                import httpx
-                
-                request_data = {
-                    "prompt": query,
-                    "session_id": session_id
-                }
-                
-                async with httpx.AsyncClient() as client:
-                    response_obj = await client.post(
-                        f"{backend_url}/chat",
-                        json=request_data,
-                        timeout=60.0
-                    )
-                    response_obj.raise_for_status()
-                    
-                    result = response_obj.json()
-                    response = result.get("response", "")
-                    tools_used = result.get("tools_used", [])
-                    
-                    # Handle both old format (list of strings) and new format (list of dicts)
-                    tool_calls = []
-                    for t in (tools_used or []):
-                        if isinstance(t, dict):
-                            tool_calls.append(t)
-                        else:
-                            tool_calls.append({"name": t, "args": {}})
-                
-                print(f"  ✓ Response: {response[:100]}...")
-                print(f"  ✓ Tools called: {len(tool_calls)}")
-                
-                trace = AgentTrace(
-                    query=test_case["customer_query"],
-                    response=response,
-                    tool_calls=tool_calls,
-                    metadata={
-                        "test_id": test_id,
-                        "agent_backend": backend_url,
-                        "session_id": session_id,
-                        "augmented_query": query,
-                        "is_multi_turn": False,
-                    }
-                )
-                traces.append(trace)
-                
-            except Exception as e:
-                print(f"  ❌ Error: {e}")
-                trace = AgentTrace(
-                    query=query,
-                    response=f"Error: {str(e)}",
-                    tool_calls=[],
-                    metadata={
-                        "test_id": test_id,
-                        "agent_backend": backend_url,
-                        "error": str(e),
-                        "is_multi_turn": False,
-                    }
-                )
-                traces.append(trace)
-        
-        print()
+    # Test cases use independent sessions, so up to --concurrency of them
+    # are in flight at once; traces keep the dataset order.
+    semaphore = asyncio.Semaphore(max(args.concurrency, 1))
+    total = len(test_cases)
+    response_cache = ResponseCache(
+        Path(__file__).parent / "eval_cache" / "responses.jsonl", args.cache_mode
+    )
+
+    async def run_bounded(client, i: int, test_case: Dict[str, Any]) -> AgentTrace:
+        key = response_cache.key(agent_name, backend_url, test_case)
+        cached = response_cache.get(key)
+        if cached is not None:
+            print(f"[{i}/{total}] {test_case['id']} (cached response)")
+            return cached
+        async with semaphore:
+            trace = await run_test_case(client, test_case, f"[{i}/{total}]", backend_url, agent_name)
+        response_cache.put(key, trace)
+        return trace
+
+    import httpx
+    async with httpx.AsyncClient() as client:
+        traces = list(await asyncio.gather(
+            *(run_bounded(client, i, tc) for i, tc in enumerate(test_cases, 1))
+        ))
+    print()
     
     # 6. Generate evaluation_input_data.jsonl for Foundry integration
     print(f"{'=' * 80}")
@@ -884,7 +994,11 @@ async def main():
         print(f"EVALUATING RESULTS (LOCAL)")
         print(f"{'=' * 80}\n")
         
-        runner = AgentEvaluationRunner(dataset_path=str(dataset_path))
+        runner = AgentEvaluationRunner(
+            dataset_path=str(dataset_path),
+            grader_cache_mode=args.cache_mode,
+            combined_graders=args.combined_graders,
+        )
         summary = runner.run_evaluation(
             traces,
             output_dir=str(Path(__file__).parent / "eval_results")
@@ -75,19 +75,8 @@ def setup_observability(
         # Enable Agent Framework instrumentation
         enable_instrumentation(enable_sensitive_data=enable_sensitive_data)
         
-        # Workaround: agent_framework._tools.py calls
-        # model_dump_json(ensure_ascii=False), but Pydantic v2 doesn't
-        # support that kwarg, causing every tool call to fail with
-        # "Function failed". Monkeypatch BaseModel.model_dump_json to
-        # silently strip unsupported kwargs so observability doesn't
-        # break tool execution.  Remove once the library is fixed.
-        import pydantic
-        _orig_mdj = pydantic.BaseModel.model_dump_json
-        def _safe_model_dump_json(self, **kwargs):
-            kwargs.pop("ensure_ascii", None)
-            return _orig_mdj(self, **kwargs)
-        pydantic.BaseModel.model_dump_json = _safe_model_dump_json  # type: ignore[assignment]
-        
+        _patch_model_dump_json_if_needed()
+
         _initialized = True
         print(f"✅ Application Insights observability enabled (service: {service_name})")
         logger.info(f"✅ Application Insights observability enabled (service: {service_name})")
@@ -106,6 +95,38 @@ def setup_observability(
         return False
 
 
+def _patch_model_dump_json_if_needed() -> None:
+    """
+    Workaround: agent_framework._tools.py calls
+    model_dump_json(ensure_ascii=False), but Pydantic releases before 2.12
+    don't support that kwarg, causing every tool call to fail with
+    "Function failed". On those releases, patch BaseModel.model_dump_json to
+    strip the kwarg so observability doesn't break tool execution.
+
+    Newer Pydantic accepts ensure_ascii natively, so the patch (and its extra
+    frame on every tool result) is skipped there.
+    """
+    import functools
+    import inspect
+    import pydantic
+
+    orig = pydantic.BaseModel.model_dump_json
+    if "ensure_ascii" in inspect.signature(orig).parameters:
+        return
+
+    @functools.wraps(orig)
+    def _safe_model_dump_json(self, _orig=orig, **kwargs):
+        kwargs.pop("ensure_ascii", None)
+        return _orig(self, **kwargs)
+
+    pydantic.BaseModel.model_dump_json = _safe_model_dump_json  # type: ignore[assignment]
+    logger.warning(
+        "Patched pydantic.BaseModel.model_dump_json to ignore ensure_ascii "
+        "(pydantic %s); remove once pydantic>=2.12 is pinned.",
+        pydantic.VERSION,
+    )
+
+
 def get_tracer(name: str = "contoso-agent"):
     """Get an OpenTelemetry tracer for creating custom spans."""
     from agent_framework.observability import get_tracer as af_get_tracer
@@ -9,17 +9,23 @@ This backend provides:
 The UI connects here instead of managing workflow directly.
 """
 
+from __future__ import annotations
+
 import asyncio
-import json
+import functools
 import logging
 import os
 import sys
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any
 
 from pathlib import Path
 
+import orjson
 from dotenv import load_dotenv
 
 # Load environment first so observability can read connection string
@@ -44,16 +50,21 @@ if os.getenv("BACKEND_OBSERVABILITY", "false").lower() in ("1", "true", "yes"):
         _observability_enabled = False
 
 # ------------------------------------------------------------------
-from azure.identity import DefaultAzureCredential
+from azure.identity import (
+    ChainedTokenCredential,
+    DefaultAzureCredential,
+    EnvironmentCredential,
+    ManagedIdentityCredential,
+)
 from durabletask.azuremanaged.client import DurableTaskSchedulerClient
 from durabletask.client import OrchestrationState
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
-from event_producer import EventProducer, CUSTOMER_PROFILES, TelemetryEvent
+from event_producer import EventProducer, CUSTOMER_NAMES, TelemetryEvent
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -61,11 +72,36 @@ logger = logging.getLogger(__name__)
 if _observability_enabled:
     logger.info("✅ Application Insights observability enabled for fraud workflow backend")
 
+# Timestamps on outgoing messages may be up to this stale
+_NOW_ISO_MAX_AGE_SECONDS = 0.25
+_now_iso_cache: tuple[float, str] = (float("-inf"), "")
+
+
+def now_iso() -> str:
+    """Current local time as ISO-8601, refreshed at most every 250 ms."""
+    global _now_iso_cache
+    t = time.monotonic()
+    if t - _now_iso_cache[0] > _NOW_ISO_MAX_AGE_SECONDS:
+        _now_iso_cache = (t, datetime.now().isoformat())
+    return _now_iso_cache[1]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run startup() before serving and shutdown() after (both defined below)."""
+    await startup()
+    try:
+        yield
+    finally:
+        await shutdown()
+
+
 # FastAPI app
 app = FastAPI(
     title="Durable Fraud Detection API",
     description="Hybrid Workflow + Durable Task architecture for fraud detection",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS - allow localhost for dev and Azure Container Apps for prod
@@ -78,12 +114,17 @@ CORS_ORIGINS = [
 # Add Azure Container Apps URL if set
 if os.getenv("CONTAINER_APP_URL"):
     CORS_ORIGINS.append(os.getenv("CONTAINER_APP_URL"))
+# Optional pattern for dynamic URLs, e.g. r"https://.*\.azurecontainerapps\.io"
+# (compiled once by the middleware)
+CORS_ORIGIN_REGEX = os.getenv("CORS_ORIGIN_REGEX") or None
 
+# Requests without an Origin header and WebSocket upgrades bypass CORS
+# processing. The UI sends no cookies, so credentialed CORS is not needed.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
+    allow_origin_regex=CORS_ORIGIN_REGEX,
+    allow_methods=["GET", "POST", "OPTIONS"],
     allow_headers=["*"],
 )
 
@@ -186,72 +227,173 @@ SAMPLE_ALERTS = [
     ),
 ]
 
+# The sample list never changes, so GET /api/alerts serves these bytes as-is
+_ALERTS_JSON = orjson.dumps([alert.model_dump() for alert in SAMPLE_ALERTS])
+
 
 # ============================================================================
 # DTS Client
 # ============================================================================
 
+# One credential per process: its in-memory token cache is shared by every
+# caller. With AZURE_CLIENT_ID set, a service principal from the environment
+# and then that user-assigned managed identity are tried before the developer
+# sources of DefaultAzureCredential (Azure CLI, ...).
+_AZURE_CLIENT_ID = os.getenv("AZURE_CLIENT_ID")
+_CREDENTIAL = (
+    ChainedTokenCredential(
+        EnvironmentCredential(),
+        ManagedIdentityCredential(client_id=_AZURE_CLIENT_ID),
+        DefaultAzureCredential(
+            exclude_environment_credential=True,
+            exclude_managed_identity_credential=True,
+            exclude_visual_studio_code_credential=True,
+            exclude_powershell_credential=True,
+        ),
+    )
+    if _AZURE_CLIENT_ID
+    else DefaultAzureCredential(
+        exclude_visual_studio_code_credential=True,
+        exclude_powershell_credential=True,
+    )
+)
+
 _dts_client: DurableTaskSchedulerClient | None = None
+_dts_client_lock = threading.Lock()
+
+
+def _build_dts_client() -> DurableTaskSchedulerClient:
+    """Create a DTS client (credential + gRPC channel)."""
+    taskhub = os.getenv("DTS_TASKHUB", "default")
+    endpoint = os.getenv("DTS_ENDPOINT", "http://localhost:8080")
+
+    credential = None if endpoint.startswith("http://localhost") else _CREDENTIAL
+
+    client = DurableTaskSchedulerClient(
+        host_address=endpoint,
+        secure_channel=not endpoint.startswith("http://localhost"),
+        taskhub=taskhub,
+        token_credential=credential,
+    )
+    logger.info(f"DTS client initialized: {endpoint}/{taskhub}")
+    return client
 
 
 def get_dts_client() -> DurableTaskSchedulerClient:
-    """Get or create DTS client."""
+    """Get or create the shared DTS client.
+
+    Normally warmed in the startup handler; the lock keeps a cold-start burst
+    of requests from each building its own credential and channel.
+    """
     global _dts_client
-    
+
     if _dts_client is None:
-        taskhub = os.getenv("DTS_TASKHUB", "default")
-        endpoint = os.getenv("DTS_ENDPOINT", "http://localhost:8080")
-        
-        credential = None if endpoint.startswith("http://localhost") else DefaultAzureCredential()
-        
-        _dts_client = DurableTaskSchedulerClient(
-            host_address=endpoint,
-            secure_channel=not endpoint.startswith("http://localhost"),
-            taskhub=taskhub,
-            token_credential=credential,
-        )
-        logger.info(f"DTS client initialized: {endpoint}/{taskhub}")
-    
+        with _dts_client_lock:
+            if _dts_client is None:
+                _dts_client = _build_dts_client()
+
     return _dts_client
 
 
+# The DTS client is synchronous gRPC; run its calls on a thread pool so they
+# don't stall WebSocket sends and SSE streams on the event loop.
+DTS_THREAD_POOL_SIZE = int(os.getenv("DTS_THREAD_POOL_SIZE", "32"))
+
+
+async def run_dts_call(func, /, *args, **kwargs):
+    """Run a blocking DTS client call in the default executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
 # ============================================================================
 # WebSocket Manager
 # ============================================================================
 
 
+# Per-client send timeout; clients slower than this are dropped
+BROADCAST_SEND_TIMEOUT_SECONDS = 5.0
+# Frames buffered per client before the oldest is dropped
+OUTBOUND_QUEUE_SIZE = 64
+
+
 class ConnectionManager:
-    """Manages WebSocket connections for real-time updates."""
+    """Manages WebSocket connections for real-time updates.
+
+    Each connection gets a bounded outbound queue drained by one long-lived
+    relay task, so broadcasting never waits on a slow client.
+    """
 
     def __init__(self):
-        self.active_connections: dict[str, list[WebSocket]] = {}  # instance_id -> connections
+        self.active_connections: dict[str, set[WebSocket]] = {}  # instance_id -> connections
+        self._queues: dict[WebSocket, asyncio.Queue[str]] = {}
+        self._relays: dict[WebSocket, asyncio.Task] = {}
 
     async def connect(self, websocket: WebSocket, instance_id: str):
         await websocket.accept()
-        if instance_id not in self.active_connections:
-            self.active_connections[instance_id] = []
-        self.active_connections[instance_id].append(websocket)
+        self.active_connections.setdefault(instance_id, set()).add(websocket)
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        self._queues[websocket] = queue
+        self._relays[websocket] = asyncio.create_task(self._relay(websocket, instance_id, queue))
         logger.info(f"WebSocket connected for instance {instance_id}")
 
     def disconnect(self, websocket: WebSocket, instance_id: str):
-        if instance_id in self.active_connections:
-            self.active_connections[instance_id].remove(websocket)
-            if not self.active_connections[instance_id]:
-                del self.active_connections[instance_id]
+        # Both the relay (on a failed send) and the endpoint (on close) call
+        # this; only the first does any cleanup or logging
+        if self._queues.pop(websocket, None) is None:
+            return
+        relay = self._relays.pop(websocket, None)
+        if relay is not None and relay is not asyncio.current_task():
+            relay.cancel()
+
+        connections = self.active_connections[instance_id]
+        connections.discard(websocket)
+        if not connections:
+            del self.active_connections[instance_id]
+            # Last subscriber gone: no one is left to receive its updates
+            stop_status_polling(instance_id)
         logger.info(f"WebSocket disconnected for instance {instance_id}")
 
+    async def _relay(self, websocket: WebSocket, instance_id: str, queue: asyncio.Queue[str]):
+        """Send queued frames to one client until a send fails or stalls."""
+        while True:
+            payload = await queue.get()
+            try:
+                await asyncio.wait_for(websocket.send_text(payload), BROADCAST_SEND_TIMEOUT_SECONDS)
+            except Exception:
+                break
+        self.disconnect(websocket, instance_id)
+
+    def relay_tasks(self) -> list[asyncio.Task]:
+        """Snapshot of the running relay tasks (for shutdown)."""
+        return list(self._relays.values())
+
+    def send(self, websocket: WebSocket, payload: str) -> bool:
+        """Queue a serialized frame for one client.
+
+        Returns False if the client is no longer connected.
+        """
+        queue = self._queues.get(websocket)
+        if queue is None:
+            return False
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.warning("WebSocket client is falling behind, dropping its oldest queued message")
+            queue.get_nowait()
+            queue.put_nowait(payload)
+        return True
+
     async def broadcast(self, instance_id: str, message: dict):
         """Broadcast message to all connections watching this instance."""
-        if instance_id in self.active_connections:
-            disconnected = []
-            for connection in self.active_connections[instance_id]:
-                try:
-                    await connection.send_json(message)
-                except Exception:
-                    disconnected.append(connection)
-            
-            for conn in disconnected:
-                self.disconnect(conn, instance_id)
+        connections = self.active_connections.get(instance_id)
+        if not connections:
+            return
+
+        # Serialize once for all subscribers
+        payload = orjson.dumps(message).decode()
+        for connection in connections:
+            self.send(connection, payload)
 
 
 manager = ConnectionManager()
@@ -271,96 +413,153 @@ _event_producer_task: asyncio.Task | None = None
 # Background Task: Poll DTS for Status Updates
 # ============================================================================
 
-_polling_tasks: dict[str, asyncio.Task] = {}
+# All instances with at least one WebSocket subscriber are polled by a single
+# background task, so N open investigations cost one timer wake-up per tick.
+_watched_instances: set[str] = set()
+_last_state: dict[str, tuple[str, str | None]] = {}  # instance_id -> (status, raw custom status)
+_poller_task: asyncio.Task | None = None
+# Set when a state transition is known to have happened (e.g. a decision was
+# raised) so the poller re-reads DTS immediately instead of waiting out the
+# fallback interval.
+_poll_wake = asyncio.Event()
+
+# Safety-net poll interval between wake-ups
+STATUS_POLL_INTERVAL_SECONDS = float(os.getenv("STATUS_POLL_INTERVAL_SECONDS", "1.0"))
+# Window for merging wake-ups that arrive in quick succession
+STATUS_COALESCE_SECONDS = 0.05
+
+TERMINAL_STATUSES = ("COMPLETED", "FAILED", "TERMINATED")
+
+
+def wake_status_polling(instance_id: str):
+    """Ask the poller to refresh now if this instance is being watched."""
+    if instance_id in _watched_instances:
+        _poll_wake.set()
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_custom_status(custom_status_raw: str | None) -> tuple[str | None, dict | None]:
+    """Parse the orchestrator's custom status into (message, step_details).
+
+    Cached by raw string: the same status is re-read on every poll until
+    the orchestrator moves on, and reconnecting clients see it again.
+    """
+    if not custom_status_raw:
+        return custom_status_raw, None
+
+    try:
+        parsed = orjson.loads(custom_status_raw)
+        # Handle double-encoding: if parsed is still a string, parse again
+        if isinstance(parsed, str):
+            try:
+                parsed = orjson.loads(parsed)
+            except orjson.JSONDecodeError:
+                pass  # Keep as string
+    except orjson.JSONDecodeError:
+        return custom_status_raw, None  # Keep original string
+
+    if isinstance(parsed, dict):
+        return parsed.get("message", custom_status_raw), parsed.get("step_details")
+    return custom_status_raw, None
+
+
+async def _publish_state(instance_id: str, state: OrchestrationState) -> bool:
+    """Broadcast a status update if the state changed. Returns True when terminal."""
+    status = state.runtime_status.name
+    custom_status_raw = state.serialized_custom_status
+
+    # Only broadcast if status changed
+    if _last_state.get(instance_id) != (status, custom_status_raw):
+        custom_status, step_details = _parse_custom_status(custom_status_raw)
+
+        message = {
+            "type": "status_update",
+            "instance_id": instance_id,
+            "status": status,
+            "custom_status": custom_status,
+            "step_details": step_details,
+            "timestamp": now_iso(),
+        }
+
+        # Check if waiting for analyst
+        if custom_status and "Awaiting analyst" in custom_status:
+            message["decision_required"] = True
+
+        # Check if completed
+        if status in TERMINAL_STATUSES:
+            if state.serialized_output:
+                try:
+                    message["result"] = orjson.loads(state.serialized_output)
+                except orjson.JSONDecodeError:
+                    message["result"] = {"raw": state.serialized_output}
+
+        await manager.broadcast(instance_id, message)
+        _last_state[instance_id] = (status, custom_status_raw)
+
+    return status in TERMINAL_STATUSES
+
+
+def _stop_watching(instance_id: str):
+    _watched_instances.discard(instance_id)
+    _last_state.pop(instance_id, None)
 
 
-async def poll_orchestration_status(instance_id: str):
-    """Background task to poll DTS and broadcast status updates."""
+async def poll_orchestration_status():
+    """Background task: poll DTS for every watched instance and broadcast changes."""
+    global _poller_task
+
     client = get_dts_client()
-    last_status = None
-    last_custom_status = None
-    
-    while instance_id in manager.active_connections:
-        try:
-            state = client.get_orchestration_state(instance_id)
-            
-            if state:
-                status = state.runtime_status.name
-                custom_status_raw = state.serialized_custom_status
-                
-                # Debug: log raw custom_status
-                # logger.info(f"[Backend] Raw custom_status: {custom_status_raw[:200] if custom_status_raw else 'None'}")
-                
-                # Parse custom_status JSON if present
-                custom_status = custom_status_raw
-                step_details = None
-                status_message = custom_status_raw
-                
-                if custom_status_raw:
-                    try:
-                        parsed = json.loads(custom_status_raw)
-                        # Handle double-encoding: if parsed is still a string, parse again
-                        if isinstance(parsed, str):
-                            try:
-                                parsed = json.loads(parsed)
-                            except json.JSONDecodeError:
-                                pass  # Keep as string
-                        
-                        if isinstance(parsed, dict):
-                            status_message = parsed.get("message", custom_status_raw)
-                            step_details = parsed.get("step_details")
-                            custom_status = status_message
-                    except json.JSONDecodeError:
-                        pass  # Keep original string
-                
-                # Only broadcast if status changed
-                if status != last_status or custom_status_raw != last_custom_status:
-                    message = {
-                        "type": "status_update",
-                        "instance_id": instance_id,
-                        "status": status,
-                        "custom_status": custom_status,
-                        "step_details": step_details,
-                        "timestamp": datetime.now().isoformat(),
-                    }
-                    
-                    # Check if waiting for analyst
-                    if custom_status and "Awaiting analyst" in custom_status:
-                        message["decision_required"] = True
-                    
-                    # Check if completed
-                    if status in ("COMPLETED", "FAILED", "TERMINATED"):
-                        if state.serialized_output:
-                            try:
-                                message["result"] = json.loads(state.serialized_output)
-                            except json.JSONDecodeError:
-                                message["result"] = {"raw": state.serialized_output}
-                    
-                    await manager.broadcast(instance_id, message)
-                    
-                    last_status = status
-                    last_custom_status = custom_status_raw
-                
-                # Stop polling if completed
-                if status in ("COMPLETED", "FAILED", "TERMINATED"):
-                    logger.info(f"Orchestration {instance_id} completed, stopping poll")
-                    break
-        
-        except Exception as e:
-            logger.error(f"Error polling status for {instance_id}: {e}")
-        
-        await asyncio.sleep(0.1)  # Poll every 100ms for responsive UI
-    
-    # Cleanup
-    if instance_id in _polling_tasks:
-        del _polling_tasks[instance_id]
+    try:
+        while _watched_instances:
+            instance_ids = list(_watched_instances)
+            states = await asyncio.gather(
+                *(run_dts_call(client.get_orchestration_state, iid) for iid in instance_ids),
+                return_exceptions=True,
+            )
+
+            for instance_id, state in zip(instance_ids, states):
+                if isinstance(state, Exception):
+                    logger.error(f"Error polling status for {instance_id}: {state}")
+                    continue
+                if not state or instance_id not in _watched_instances:
+                    continue
+                try:
+                    if await _publish_state(instance_id, state):
+                        logger.info(f"Orchestration {instance_id} completed, stopping poll")
+                        _stop_watching(instance_id)
+                except Exception as e:
+                    logger.error(f"Error broadcasting status for {instance_id}: {e}")
+
+            if not _watched_instances:
+                break
+
+            # Sleep until woken by a known transition, or the fallback interval
+            try:
+                await asyncio.wait_for(_poll_wake.wait(), timeout=STATUS_POLL_INTERVAL_SECONDS)
+                # Let a burst of transitions settle so only the latest state is sent
+                await asyncio.sleep(STATUS_COALESCE_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            _poll_wake.clear()
+    finally:
+        _poller_task = None
 
 
 def start_status_polling(instance_id: str):
-    """Start background polling for an instance."""
-    if instance_id not in _polling_tasks:
-        task = asyncio.create_task(poll_orchestration_status(instance_id))
-        _polling_tasks[instance_id] = task
+    """Start watching an instance, launching the shared poller if needed."""
+    global _poller_task
+
+    _watched_instances.add(instance_id)
+    _poll_wake.set()
+    if _poller_task is None or _poller_task.done():
+        _poller_task = asyncio.create_task(poll_orchestration_status())
+
+
+def stop_status_polling(instance_id: str):
+    """Stop watching an instance; wakes the poller so it exits if idle."""
+    _stop_watching(instance_id)
+    if not _watched_instances:
+        _poll_wake.set()
 
 
 # ============================================================================
@@ -368,32 +567,44 @@ def start_status_polling(instance_id: str):
 # ============================================================================
 
 
-@app.get("/")
-async def read_root():
-    """Serve the React frontend index.html."""
-    index_path = STATIC_DIR / "index.html"
-    if index_path.exists():
-        return FileResponse(str(index_path))
-    return {
-        "message": "Durable Fraud Detection API",
-        "version": "1.0.0",
-        "docs": "/docs",
-    }
+def _model_response(model: BaseModel) -> Response:
+    """Serialize a response model directly with Pydantic's JSON encoder.
+
+    Skips FastAPI's response_model validation and jsonable_encoder pass;
+    routes declare the model under ``responses=`` so the OpenAPI schema
+    is unchanged.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+INDEX_HTML = STATIC_DIR / "index.html"
+
+if not INDEX_HTML.exists():
+    # With a React build present, "/" is served by the static mount at the
+    # bottom of this module instead.
+    @app.get("/")
+    async def read_root():
+        """API banner when no React build is bundled."""
+        return {
+            "message": "Durable Fraud Detection API",
+            "version": "1.0.0",
+            "docs": "/docs",
+        }
 
 
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return {"status": "healthy", "timestamp": now_iso()}
 
 
-@app.get("/api/alerts", response_model=list[AlertInfo])
+@app.get("/api/alerts", responses={200: {"model": list[AlertInfo]}})
 async def get_alerts():
     """Get sample alerts."""
-    return SAMPLE_ALERTS
+    return Response(content=_ALERTS_JSON, media_type="application/json")
 
 
-@app.post("/api/workflow/start", response_model=StartWorkflowResponse)
+@app.post("/api/workflow/start", responses={200: {"model": StartWorkflowResponse}})
 async def start_workflow(request: StartWorkflowRequest):
     """Start a new fraud detection orchestration."""
     client = get_dts_client()
@@ -403,49 +614,51 @@ async def start_workflow(request: StartWorkflowRequest):
         "customer_id": request.customer_id,
         "alert_type": request.alert_type,
         "description": request.description,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso(),
         "severity": request.severity,
         "approval_timeout_hours": request.approval_timeout_hours,
     }
     
-    instance_id = client.schedule_new_orchestration(
+    instance_id = await run_dts_call(
+        client.schedule_new_orchestration,
         ORCHESTRATION_NAME,
         input=alert,
-        instance_id=f"fraud-{request.alert_id}-{int(time.time())}",
+        instance_id=f"fraud-{request.alert_id}-{uuid.uuid4().hex[:12]}",
     )
     
     logger.info(f"Started orchestration {instance_id} for alert {request.alert_id}")
     
-    return StartWorkflowResponse(
+    return _model_response(StartWorkflowResponse(
         instance_id=instance_id,
         alert_id=request.alert_id,
         status="started",
-    )
+    ))
 
 
-@app.get("/api/workflow/status/{instance_id}", response_model=WorkflowStatusResponse)
+@app.get("/api/workflow/status/{instance_id}", responses={200: {"model": WorkflowStatusResponse}})
 async def get_workflow_status(instance_id: str):
     """Get current status of an orchestration."""
     client = get_dts_client()
     
-    state = client.get_orchestration_state(instance_id)
+    state = await run_dts_call(client.get_orchestration_state, instance_id)
     
     if not state:
         raise HTTPException(status_code=404, detail="Orchestration not found")
     
     result = None
-    if state.serialized_output:
+    # Output only exists once the orchestration has finished
+    if state.runtime_status.name in TERMINAL_STATUSES and state.serialized_output:
         try:
-            result = json.loads(state.serialized_output)
-        except json.JSONDecodeError:
+            result = orjson.loads(state.serialized_output)
+        except orjson.JSONDecodeError:
             result = {"raw": state.serialized_output}
     
-    return WorkflowStatusResponse(
+    return _model_response(WorkflowStatusResponse(
         instance_id=instance_id,
         status=state.runtime_status.name,
         custom_status=state.serialized_custom_status,
         result=result,
-    )
+    ))
 
 
 @app.post("/api/workflow/decision")
@@ -462,23 +675,28 @@ async def submit_decision(request: AnalystDecisionRequest):
         "analyst_id": request.analyst_id,
     }
     
-    client.raise_orchestration_event(
+    await run_dts_call(
+        client.raise_orchestration_event,
         instance_id=request.instance_id,
         event_name=ANALYST_APPROVAL_EVENT,
         data=decision,
     )
     
     logger.info(f"Submitted decision for {request.instance_id}: {request.approved_action}")
+    wake_status_polling(request.instance_id)
     
     # Broadcast decision event
     await manager.broadcast(request.instance_id, {
         "type": "decision_submitted",
         "instance_id": request.instance_id,
         "action": request.approved_action,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso(),
     })
     
-    return {"status": "submitted", "instance_id": request.instance_id}
+    return Response(
+        content=orjson.dumps({"status": "submitted", "instance_id": request.instance_id}),
+        media_type="application/json",
+    )
 
 
 # ============================================================================
@@ -493,18 +711,19 @@ async def event_stream():
     The React UI connects here with EventSource to display the Live Feed panel.
     Events are JSON objects with event_type, customer_name, is_anomaly, etc.
     """
-    queue = event_producer.subscribe()
+    subscriber = event_producer.subscribe()
 
     async def generate():
         try:
             while True:
-                event = await queue.get()
-                data = json.dumps(event.to_dict())
-                yield f"data: {data}\n\n"
+                events = await subscriber.drain()
+                # One chunk per wake-up; orjson serializes the TelemetryEvent
+                # dataclass directly
+                yield b"".join(b"data: " + orjson.dumps(event) + b"\n\n" for event in events)
         except asyncio.CancelledError:
             pass
         finally:
-            event_producer.unsubscribe(queue)
+            event_producer.unsubscribe(subscriber)
 
     return StreamingResponse(generate(), media_type="text/event-stream", headers={
         "Cache-Control": "no-cache",
@@ -518,6 +737,11 @@ async def event_stream():
 # ============================================================================
 
 
+# Keepalive frames, serialized once
+_PING = orjson.dumps({"type": "ping"}).decode()
+_PONG = orjson.dumps({"type": "pong"}).decode()
+
+
 @app.websocket("/ws/{instance_id}")
 async def websocket_endpoint(websocket: WebSocket, instance_id: str):
     """
@@ -527,21 +751,27 @@ async def websocket_endpoint(websocket: WebSocket, instance_id: str):
     """
     await manager.connect(websocket, instance_id)
     
-    # Start polling for this instance
-    start_status_polling(instance_id)
-    
     try:
         # Send initial status
-        client = get_dts_client()
-        state = client.get_orchestration_state(instance_id)
+        try:
+            client = get_dts_client()
+            state = await run_dts_call(client.get_orchestration_state, instance_id)
+        except Exception as e:
+            # The poller still delivers status updates to this client
+            logger.warning(f"Initial status fetch failed for {instance_id}: {e}")
+            state = None
         
         if state:
-            await websocket.send_json({
+            manager.send(websocket, orjson.dumps({
                 "type": "initial_status",
                 "instance_id": instance_id,
                 "status": state.runtime_status.name,
                 "custom_status": state.serialized_custom_status,
-            })
+            }).decode())
+        
+        # Start polling only once initial_status is queued, so no status_update
+        # can reach this client ahead of it
+        start_status_polling(instance_id)
         
         # Keep connection alive
         while True:
@@ -551,17 +781,15 @@ async def websocket_endpoint(websocket: WebSocket, instance_id: str):
                 
                 # Handle client commands
                 try:
-                    message = json.loads(data)
+                    message = orjson.loads(data)
                     if message.get("type") == "ping":
-                        await websocket.send_json({"type": "pong"})
-                except json.JSONDecodeError:
+                        manager.send(websocket, _PONG)
+                except orjson.JSONDecodeError:
                     pass
                     
             except asyncio.TimeoutError:
                 # Send ping to keep connection alive
-                try:
-                    await websocket.send_json({"type": "ping"})
-                except Exception:
+                if not manager.send(websocket, _PING):
                     break
                     
     except WebSocketDisconnect:
@@ -577,7 +805,6 @@ async def websocket_endpoint(websocket: WebSocket, instance_id: str):
 # ============================================================================
 
 
-@app.on_event("startup")
 async def startup():
     """Initialize on startup."""
     global _event_producer_task
@@ -585,12 +812,22 @@ async def startup():
     logger.info("="*60)
     logger.info("Starting Durable Fraud Detection Backend")
     logger.info("="*60)
+
+    # Size the default executor for concurrent DTS calls (see run_dts_call)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=DTS_THREAD_POOL_SIZE, thread_name_prefix="dts")
+    )
     
-    # DTS client is lazy-initialized on first API call (get_dts_client()).
-    # Pre-init inside uvicorn's startup causes a CancelledError on Windows
-    # because gRPC's C extension installs a SIGINT handler that conflicts
-    # with asyncio's ProactorEventLoop signal handling.
-    logger.info("✓ DTS client will initialize on first request (lazy)")
+    # Warm the DTS client so the credential and gRPC channel exist before
+    # traffic arrives. On Windows it stays lazy (first get_dts_client() call):
+    # pre-init inside uvicorn's startup causes a CancelledError there because
+    # gRPC's C extension installs a SIGINT handler that conflicts with
+    # asyncio's ProactorEventLoop signal handling.
+    if sys.platform == "win32":
+        logger.info("✓ DTS client will initialize on first request (lazy)")
+    else:
+        get_dts_client()
+        logger.info("✓ DTS client initialized")
     
     # Start Layer 1 event producer (ambient detection)
     if os.getenv("EVENT_PRODUCER_ENABLED", "true").lower() in ("1", "true", "yes"):
@@ -603,24 +840,26 @@ async def startup():
                     "customer_id": customer_id,
                     "alert_type": alert_type,
                     "description": description,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso(),
                     "severity": severity,
                     "approval_timeout_hours": 0.05,
                     "auto_detected": True,
                 }
-                instance_id = client.schedule_new_orchestration(
+                instance_id = await run_dts_call(
+                    client.schedule_new_orchestration,
                     ORCHESTRATION_NAME,
                     input=alert,
-                    instance_id=f"fraud-{alert_id}-{int(time.time())}",
+                    instance_id=f"fraud-{alert_id}-{uuid.uuid4().hex[:12]}",
                 )
                 logger.info(f"🤖 Auto-submitted alert {alert_id} → orchestration {instance_id}")
+                wake_status_polling(instance_id)
 
                 # Broadcast workflow_auto_started to SSE so the UI can connect
                 started_event = TelemetryEvent(
                     id=f"WF-{alert_id}",
                     timestamp=alert["timestamp"],
                     customer_id=customer_id,
-                    customer_name=CUSTOMER_PROFILES.get(customer_id, {}).get("name", f"Customer {customer_id}"),
+                    customer_name=CUSTOMER_NAMES.get(customer_id) or f"Customer {customer_id}",
                     event_type="workflow_auto_started",
                     details={
                         "instance_id": instance_id,
@@ -633,7 +872,7 @@ async def startup():
                     anomaly_rule=alert_type,
                     alert_triggered=True,
                 )
-                await event_producer._broadcast(started_event)
+                event_producer._broadcast(started_event)
             except Exception as e:
                 logger.error(f"Failed to auto-submit alert: {e}")
         
@@ -646,19 +885,27 @@ async def startup():
     logger.info("Backend ready! 🚀")
 
 
-@app.on_event("shutdown")
 async def shutdown():
     """Cleanup on shutdown."""
     logger.info("Shutting down backend...")
     
     # Stop event producer
     event_producer.stop()
-    if _event_producer_task:
-        _event_producer_task.cancel()
-    
-    # Cancel polling tasks
-    for task in _polling_tasks.values():
+
+    # Cancel the event producer, status poller and WebSocket relays, then
+    # wait for them to unwind so none is destroyed while still pending
+    tasks = [t for t in (_event_producer_task, _poller_task) if t]
+    tasks.extend(manager.relay_tasks())
+    for task in tasks:
         task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# Serve the React app (index.html at "/") via StaticFiles, which handles stat
+# caching, ETag/Last-Modified and 304s. Mounted last so it never shadows the
+# API and WebSocket routes above.
+if INDEX_HTML.exists():
+    app.mount("/", StaticFiles(directory=str(STATIC_DIR), html=True), name="spa")
 
 
 # ============================================================================
@@ -675,4 +922,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=port,
         log_level="info",
+        # libuv-backed loop for the WebSocket/SSE traffic; not available on Windows
+        loop="uvloop" if sys.platform != "win32" else "auto",
     )
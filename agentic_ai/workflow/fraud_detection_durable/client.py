@@ -17,6 +17,7 @@ import json
 import logging
 import os
 import time
+import uuid
 from datetime import datetime
 
 from azure.identity import DefaultAzureCredential
@@ -99,7 +100,7 @@ def start_orchestration(client: DurableTaskSchedulerClient, alert: dict) -> str:
     instance_id = client.schedule_new_orchestration(
         ORCHESTRATION_NAME,
         input=alert,
-        instance_id=f"fraud-{alert['alert_id']}-{int(time.time())}",
+        instance_id=f"fraud-{alert['alert_id']}-{uuid.uuid4().hex[:12]}",
     )
     logger.info(f"Started orchestration with instance ID: {instance_id}")
     return instance_id
@@ -118,8 +119,8 @@ def wait_for_status(
     poll_interval: float = 1.0,
 ) -> OrchestrationState | None:
     """Wait for orchestration to reach a specific status."""
-    start = time.time()
-    while time.time() - start < timeout:
+    start = time.monotonic()
+    while time.monotonic() - start < timeout:
         state = get_status(client, instance_id)
         if state:
             current_status = state.runtime_status.name
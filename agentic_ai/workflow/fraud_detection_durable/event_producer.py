@@ -14,13 +14,16 @@ Live Feed panel.
 """
 
 import asyncio
+import functools
 import logging
 import random
 import time
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Callable, NamedTuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -37,16 +40,62 @@ NORMAL_COUNTRIES = {
     4: ["Japan", "Australia"],
     5: ["USA", "India"],
 }
+# Countries a customer doesn't normally log in from (anomalous logins)
+UNUSUAL_COUNTRIES = {
+    cid: tuple(c for c in COUNTRIES if c not in normal) for cid, normal in NORMAL_COUNTRIES.items()
+}
+
+class CustomerProfile(NamedTuple):
+    name: str
+    avg_transaction: float
+    avg_daily_data_gb: float
+    subscription_id: int
+
 
 CUSTOMER_PROFILES = {
-    1: {"name": "Alice Johnson", "avg_transaction": 85.0, "avg_daily_data_gb": 1.2, "subscription_id": 5},
-    2: {"name": "Bob Smith", "avg_transaction": 120.0, "avg_daily_data_gb": 2.5, "subscription_id": 8},
-    3: {"name": "Carlos Rivera", "avg_transaction": 200.0, "avg_daily_data_gb": 0.8, "subscription_id": 12},
-    4: {"name": "Diana Chen", "avg_transaction": 55.0, "avg_daily_data_gb": 3.0, "subscription_id": 3},
-    5: {"name": "Ethan Patel", "avg_transaction": 150.0, "avg_daily_data_gb": 1.8, "subscription_id": 7},
+    1: CustomerProfile(name="Alice Johnson", avg_transaction=85.0, avg_daily_data_gb=1.2, subscription_id=5),
+    2: CustomerProfile(name="Bob Smith", avg_transaction=120.0, avg_daily_data_gb=2.5, subscription_id=8),
+    3: CustomerProfile(name="Carlos Rivera", avg_transaction=200.0, avg_daily_data_gb=0.8, subscription_id=12),
+    4: CustomerProfile(name="Diana Chen", avg_transaction=55.0, avg_daily_data_gb=3.0, subscription_id=3),
+    5: CustomerProfile(name="Ethan Patel", avg_transaction=150.0, avg_daily_data_gb=1.8, subscription_id=7),
 }
 
+# customer_id -> display name, for callers that only need the name
+CUSTOMER_NAMES = {cid: profile.name for cid, profile in CUSTOMER_PROFILES.items()}
+CUSTOMER_IDS = tuple(CUSTOMER_PROFILES)
+
 EVENT_TYPES = ["login", "transaction", "data_usage", "api_call", "auth_failure"]
+NORMAL_MERCHANTS = ["Amazon", "Walmart", "Target", "BestBuy", "Costco"]
+
+# Per-customer rule thresholds, precomputed from the profiles
+SPENDING_SPIKE_THRESHOLDS = {cid: p.avg_transaction * 3 for cid, p in CUSTOMER_PROFILES.items()}
+DATA_SPIKE_THRESHOLDS = {cid: p.avg_daily_data_gb * 4 for cid, p in CUSTOMER_PROFILES.items()}
+
+# Alert description per anomaly rule, filled by _make_alert_description
+_ALERT_TEMPLATES = {
+    "multi_country_login": (
+        "Login from {country} detected for customer {cid} ({name}). Previous login was from {prev} "
+        "within 2 hours. Possible credential compromise or account sharing."
+    ),
+    "spending_spike": (
+        "Transaction of ${amount:.2f} detected for customer {cid} ({name}). This is {ratio:.1f}× "
+        "their average of ${avg:.2f}. Possible unauthorized purchase."
+    ),
+    "data_usage_spike": (
+        "Data usage of {gb:.1f} GB detected for customer {cid} ({name}). This is {ratio:.1f}× their "
+        "daily average of {avg:.1f} GB. Possible data exfiltration or compromised device."
+    ),
+    "rapid_auth_failures": (
+        "Multiple authentication failures detected for customer {cid} ({name}). 3+ failed attempts "
+        "in 5 minutes from suspicious IP. Possible brute-force attack."
+    ),
+}
+
+# Events broadcast within this window reach subscribers as one batch
+BROADCAST_COALESCE_SECONDS = 0.1
+
+# Same rule for the same customer won't re-alert within this window
+ALERT_DEDUP_SECONDS = 60.0
 
 
 # ============================================================================
@@ -80,6 +129,65 @@ class TelemetryEvent:
         }
 
 
+_iso_second = -1
+_iso_prefix = ""
+
+
+def fast_iso(now: float) -> str:
+    """Format a time.time() value like datetime.isoformat(), with microseconds.
+
+    The date/time prefix is only rebuilt when the whole second changes.
+    """
+    global _iso_second, _iso_prefix
+    sec = int(now)
+    if sec != _iso_second:
+        _iso_second = sec
+        _iso_prefix = datetime.fromtimestamp(sec).strftime("%Y-%m-%dT%H:%M:%S")
+    return f"{_iso_prefix}.{int((now - sec) * 1e6):06d}"
+
+
+class Subscriber:
+    """Bounded event buffer for one SSE client.
+
+    A client that falls behind loses its oldest events rather than
+    blocking the producer or other subscribers.
+    """
+
+    def __init__(self, maxlen: int = 100):
+        self.buffer: deque[TelemetryEvent] = deque(maxlen=maxlen)
+        self._wake = asyncio.Event()
+
+    def push(self, events: list[TelemetryEvent]):
+        self.buffer.extend(events)
+        self._wake.set()
+
+    async def drain(self) -> list[TelemetryEvent]:
+        """Wait until at least one event is buffered, then take them all."""
+        while not self.buffer:
+            self._wake.clear()
+            await self._wake.wait()
+        events = list(self.buffer)
+        self.buffer.clear()
+        return events
+
+
+# Random draws generated per refill of a _DrawPool
+DRAW_BATCH_SIZE = 4096
+
+
+class _DrawPool:
+    """Random draws pre-generated in NumPy batches and handed out one at a time."""
+
+    def __init__(self, fill: Callable[[int], np.ndarray]):
+        self._fill = fill
+        self._draws: list = []
+
+    def next(self):
+        if not self._draws:
+            self._draws = self._fill(DRAW_BATCH_SIZE).tolist()
+        return self._draws.pop()
+
+
 # ============================================================================
 # Event Producer
 # ============================================================================
@@ -100,21 +208,36 @@ class EventProducer:
         self.anomaly_probability = anomaly_probability
         self._running = False
         self._event_counter = 0
-        self._subscribers: list[asyncio.Queue] = []
-
-        # Per-customer state for rule evaluation
-        self._recent_logins: dict[int, deque] = {
-            cid: deque(maxlen=10) for cid in CUSTOMER_PROFILES
-        }
-        self._recent_transactions: dict[int, deque] = {
-            cid: deque(maxlen=20) for cid in CUSTOMER_PROFILES
+        self._subscribers: list[Subscriber] = []
+        self._pending: list[TelemetryEvent] = []  # awaiting the next _flush
+
+        # Per-customer state for rule evaluation, oldest entry on the left.
+        # Windows are stored column-wise: deques sharing a prefix are
+        # appended and trimmed together, so index i refers to the same entry.
+        # Times are time.monotonic() readings.
+        self._login_countries: dict[int, deque[str]] = {cid: deque(maxlen=10) for cid in CUSTOMER_PROFILES}
+        self._login_times: dict[int, deque[float]] = {cid: deque(maxlen=10) for cid in CUSTOMER_PROFILES}
+        self._tx_window_amounts: dict[int, deque[float]] = {cid: deque(maxlen=20) for cid in CUSTOMER_PROFILES}
+        self._tx_window_times: dict[int, deque[float]] = {cid: deque(maxlen=20) for cid in CUSTOMER_PROFILES}
+        self._auth_failure_times: dict[int, deque[float]] = {cid: deque(maxlen=10) for cid in CUSTOMER_PROFILES}
+
+        # Pre-generated draws for the numeric fields of normal events
+        rng = np.random.default_rng()
+        self._tx_amounts: dict[int, _DrawPool] = {
+            cid: _DrawPool(functools.partial(rng.normal, p.avg_transaction, p.avg_transaction * 0.3))
+            for cid, p in CUSTOMER_PROFILES.items()
         }
-        self._recent_auth_failures: dict[int, deque] = {
-            cid: deque(maxlen=10) for cid in CUSTOMER_PROFILES
+        self._data_usage_gb: dict[int, _DrawPool] = {
+            cid: _DrawPool(functools.partial(rng.normal, p.avg_daily_data_gb, p.avg_daily_data_gb * 0.2))
+            for cid, p in CUSTOMER_PROFILES.items()
         }
+        self._merchant_idx = _DrawPool(functools.partial(rng.integers, 0, len(NORMAL_MERCHANTS)))
 
         # Track which alerts we've fired to avoid duplicates
-        self._active_alerts: set[str] = set()
+        self._active_alerts: set[tuple[int, str]] = set()  # (customer_id, rule)
+        # (expiry time, key) in firing order; every entry shares the same TTL,
+        # so the head is always the next to expire
+        self._alert_expiry: deque[tuple[float, tuple[int, str]]] = deque()
 
         # Callback for auto-submitting alerts
         self._alert_callback: Any = None
@@ -123,27 +246,32 @@ class EventProducer:
         """Set the async callback for when an anomaly triggers an alert."""
         self._alert_callback = callback
 
-    def subscribe(self) -> asyncio.Queue:
-        """Subscribe to the event stream. Returns a queue to read events from."""
-        queue: asyncio.Queue = asyncio.Queue(maxsize=100)
-        self._subscribers.append(queue)
-        return queue
+    def subscribe(self) -> "Subscriber":
+        """Subscribe to the event stream. Returns a buffer to read events from."""
+        subscriber = Subscriber()
+        self._subscribers.append(subscriber)
+        return subscriber
 
-    def unsubscribe(self, queue: asyncio.Queue):
+    def unsubscribe(self, subscriber: "Subscriber"):
         """Unsubscribe from the event stream."""
-        if queue in self._subscribers:
-            self._subscribers.remove(queue)
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
 
-    async def _broadcast(self, event: TelemetryEvent):
-        """Send event to all SSE subscribers."""
-        dead_queues = []
-        for queue in self._subscribers:
-            try:
-                queue.put_nowait(event)
-            except asyncio.QueueFull:
-                dead_queues.append(queue)
-        for q in dead_queues:
-            self._subscribers.remove(q)
+    def _broadcast(self, event: TelemetryEvent):
+        """Send event to all SSE subscribers.
+
+        Events are held for a short window and delivered as one batch, so a
+        burst (e.g. an anomaly plus its auto-started workflow) wakes each
+        subscriber once.
+        """
+        self._pending.append(event)
+        if len(self._pending) == 1:
+            asyncio.get_running_loop().call_later(BROADCAST_COALESCE_SECONDS, self._flush)
+
+    def _flush(self):
+        batch, self._pending = self._pending, []
+        for subscriber in self._subscribers:
+            subscriber.push(batch)
 
     # ========================================================================
     # Event Generation
@@ -154,19 +282,19 @@ class EventProducer:
         profile = CUSTOMER_PROFILES[customer_id]
         event_type = random.choice(EVENT_TYPES)
         self._event_counter += 1
-        now = datetime.now()
+        timestamp = fast_iso(time.time())
 
         if event_type == "login":
             country = random.choice(NORMAL_COUNTRIES[customer_id])
             details = {"country": country, "ip": f"192.168.{random.randint(1,255)}.{random.randint(1,255)}", "success": True}
         elif event_type == "transaction":
-            amount = round(random.gauss(profile["avg_transaction"], profile["avg_transaction"] * 0.3), 2)
+            amount = round(self._tx_amounts[customer_id].next(), 2)
             amount = max(5.0, amount)  # No negative/tiny amounts
-            details = {"amount": amount, "currency": "USD", "merchant": random.choice(["Amazon", "Walmart", "Target", "BestBuy", "Costco"])}
+            details = {"amount": amount, "currency": "USD", "merchant": NORMAL_MERCHANTS[self._merchant_idx.next()]}
         elif event_type == "data_usage":
-            gb = round(random.gauss(profile["avg_daily_data_gb"], profile["avg_daily_data_gb"] * 0.2), 2)
+            gb = round(self._data_usage_gb[customer_id].next(), 2)
             gb = max(0.1, gb)
-            details = {"gb_used": gb, "subscription_id": profile["subscription_id"]}
+            details = {"gb_used": gb, "subscription_id": profile.subscription_id}
         elif event_type == "api_call":
             details = {"endpoint": random.choice(["/api/account", "/api/billing", "/api/usage", "/api/profile"]), "status_code": 200, "latency_ms": random.randint(50, 300)}
         else:  # auth_failure
@@ -174,9 +302,9 @@ class EventProducer:
 
         return TelemetryEvent(
             id=f"EVT-{self._event_counter:06d}",
-            timestamp=now.isoformat(),
+            timestamp=timestamp,
             customer_id=customer_id,
-            customer_name=profile["name"],
+            customer_name=profile.name,
             event_type=event_type,
             details=details,
         )
@@ -185,20 +313,19 @@ class EventProducer:
         """Generate an event that should trigger an anomaly rule."""
         profile = CUSTOMER_PROFILES[customer_id]
         self._event_counter += 1
-        now = datetime.now()
+        timestamp = fast_iso(time.time())
 
         anomaly_type = random.choice(["multi_country_login", "spending_spike", "data_spike", "rapid_auth_failures"])
 
         if anomaly_type == "multi_country_login":
             # Login from unusual country
-            unusual = [c for c in COUNTRIES if c not in NORMAL_COUNTRIES[customer_id]]
-            country = random.choice(unusual)
+            country = random.choice(UNUSUAL_COUNTRIES[customer_id])
             details = {"country": country, "ip": f"203.{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}", "success": True}
             return TelemetryEvent(
                 id=f"EVT-{self._event_counter:06d}",
-                timestamp=now.isoformat(),
+                timestamp=timestamp,
                 customer_id=customer_id,
-                customer_name=profile["name"],
+                customer_name=profile.name,
                 event_type="login",
                 details=details,
             )
@@ -206,13 +333,13 @@ class EventProducer:
         elif anomaly_type == "spending_spike":
             # Transaction 4-8× the average
             multiplier = random.uniform(4.0, 8.0)
-            amount = round(profile["avg_transaction"] * multiplier, 2)
+            amount = round(profile.avg_transaction * multiplier, 2)
             details = {"amount": amount, "currency": "USD", "merchant": random.choice(["LuxuryGoods.com", "HighEnd Electronics", "Crypto Exchange"])}
             return TelemetryEvent(
                 id=f"EVT-{self._event_counter:06d}",
-                timestamp=now.isoformat(),
+                timestamp=timestamp,
                 customer_id=customer_id,
-                customer_name=profile["name"],
+                customer_name=profile.name,
                 event_type="transaction",
                 details=details,
             )
@@ -220,13 +347,13 @@ class EventProducer:
         elif anomaly_type == "data_spike":
             # Data usage 5-10× the average
             multiplier = random.uniform(5.0, 10.0)
-            gb = round(profile["avg_daily_data_gb"] * multiplier, 2)
-            details = {"gb_used": gb, "subscription_id": profile["subscription_id"]}
+            gb = round(profile.avg_daily_data_gb * multiplier, 2)
+            details = {"gb_used": gb, "subscription_id": profile.subscription_id}
             return TelemetryEvent(
                 id=f"EVT-{self._event_counter:06d}",
-                timestamp=now.isoformat(),
+                timestamp=timestamp,
                 customer_id=customer_id,
-                customer_name=profile["name"],
+                customer_name=profile.name,
                 event_type="data_usage",
                 details=details,
             )
@@ -235,9 +362,9 @@ class EventProducer:
             details = {"method": "password", "reason": "invalid_credentials", "ip": f"185.{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}"}
             return TelemetryEvent(
                 id=f"EVT-{self._event_counter:06d}",
-                timestamp=now.isoformat(),
+                timestamp=timestamp,
                 customer_id=customer_id,
-                customer_name=profile["name"],
+                customer_name=profile.name,
                 event_type="auth_failure",
                 details=details,
             )
@@ -252,65 +379,94 @@ class EventProducer:
         Returns (is_anomaly, rule_name).
         """
         cid = event.customer_id
-        profile = CUSTOMER_PROFILES[cid]
+        event_type = event.event_type
+        now = time.monotonic()
 
+        # Each event type is checked by at most one rule
         # Rule 1: Multi-country login within 2 hours
-        if event.event_type == "login" and event.details.get("success"):
+        if event_type == "login" and event.details.get("success"):
             country = event.details.get("country", "")
-            recent = self._recent_logins[cid]
-            for prev in recent:
-                prev_country = prev.get("country", "")
-                prev_time = prev.get("time", 0)
-                if prev_country and prev_country != country:
-                    if time.time() - prev_time < 7200:  # 2 hours
-                        return True, "multi_country_login"
-            # Record this login
-            recent.append({"country": country, "time": time.time()})
+            countries = self._login_countries[cid]
+            times = self._login_times[cid]
+            # Drop logins older than 2 hours; everything left is in the window
+            cutoff = now - 7200
+            while times and times[0] <= cutoff:
+                times.popleft()
+                countries.popleft()
+            # Any in-window login from somewhere else?
+            if countries.count(country) != len(countries):
+                return True, "multi_country_login"
+            # Record this login (only ones with a known country)
+            if country:
+                countries.append(country)
+                times.append(now)
 
         # Rule 2: Transaction amount > 3× customer average
-        if event.event_type == "transaction":
+        elif event_type == "transaction":
             amount = event.details.get("amount", 0)
-            if amount > profile["avg_transaction"] * 3:
+            if amount > SPENDING_SPIKE_THRESHOLDS[cid]:
                 return True, "spending_spike"
-            self._recent_transactions[cid].append({"amount": amount, "time": time.time()})
+            self._tx_window_amounts[cid].append(amount)
+            self._tx_window_times[cid].append(now)
 
         # Rule 3: Data usage > 4× daily average
-        if event.event_type == "data_usage":
+        elif event_type == "data_usage":
             gb = event.details.get("gb_used", 0)
-            if gb > profile["avg_daily_data_gb"] * 4:
+            if gb > DATA_SPIKE_THRESHOLDS[cid]:
                 return True, "data_usage_spike"
 
         # Rule 4: 3+ auth failures in 5 minutes
-        if event.event_type == "auth_failure":
-            recent_failures = self._recent_auth_failures[cid]
-            recent_failures.append({"time": time.time()})
-            # Count failures in last 5 minutes
-            cutoff = time.time() - 300
-            recent_count = sum(1 for f in recent_failures if f["time"] > cutoff)
-            if recent_count >= 3:
+        elif event_type == "auth_failure":
+            recent_failures = self._auth_failure_times[cid]
+            recent_failures.append(now)
+            # Drop failures older than 5 minutes; the rest are in the window
+            cutoff = now - 300
+            while recent_failures[0] <= cutoff:
+                recent_failures.popleft()
+            if len(recent_failures) >= 3:
                 return True, "rapid_auth_failures"
 
         return False, ""
 
     def _make_alert_description(self, event: TelemetryEvent) -> str:
         """Build a human-readable alert description from an anomalous event."""
-        if event.anomaly_rule == "multi_country_login":
-            country = event.details.get("country", "unknown")
-            recent = self._recent_logins[event.customer_id]
-            prev_countries = [r["country"] for r in recent if r["country"] != country]
-            prev = prev_countries[-1] if prev_countries else "unknown"
-            return f"Login from {country} detected for customer {event.customer_id} ({event.customer_name}). Previous login was from {prev} within 2 hours. Possible credential compromise or account sharing."
-        elif event.anomaly_rule == "spending_spike":
-            amount = event.details.get("amount", 0)
-            avg = CUSTOMER_PROFILES[event.customer_id]["avg_transaction"]
-            return f"Transaction of ${amount:.2f} detected for customer {event.customer_id} ({event.customer_name}). This is {amount/avg:.1f}× their average of ${avg:.2f}. Possible unauthorized purchase."
-        elif event.anomaly_rule == "data_usage_spike":
-            gb = event.details.get("gb_used", 0)
-            avg = CUSTOMER_PROFILES[event.customer_id]["avg_daily_data_gb"]
-            return f"Data usage of {gb:.1f} GB detected for customer {event.customer_id} ({event.customer_name}). This is {gb/avg:.1f}× their daily average of {avg:.1f} GB. Possible data exfiltration or compromised device."
-        elif event.anomaly_rule == "rapid_auth_failures":
-            return f"Multiple authentication failures detected for customer {event.customer_id} ({event.customer_name}). 3+ failed attempts in 5 minutes from suspicious IP. Possible brute-force attack."
-        return f"Anomaly detected for customer {event.customer_id}: {event.anomaly_rule}"
+        rule = event.anomaly_rule
+        template = _ALERT_TEMPLATES.get(rule)
+        if template is None:
+            return f"Anomaly detected for customer {event.customer_id}: {rule}"
+
+        cid = event.customer_id
+        details = event.details
+        fields: dict[str, Any] = {"cid": cid, "name": event.customer_name}
+        if rule == "multi_country_login":
+            country = fields["country"] = details.get("country", "unknown")
+            prev_countries = [c for c in self._login_countries[cid] if c != country]
+            fields["prev"] = prev_countries[-1] if prev_countries else "unknown"
+        elif rule == "spending_spike":
+            amount = fields["amount"] = details.get("amount", 0)
+            avg = fields["avg"] = CUSTOMER_PROFILES[cid].avg_transaction
+            fields["ratio"] = amount / avg
+        elif rule == "data_usage_spike":
+            gb = fields["gb"] = details.get("gb_used", 0)
+            avg = fields["avg"] = CUSTOMER_PROFILES[cid].avg_daily_data_gb
+            fields["ratio"] = gb / avg
+        return template.format_map(fields)
+
+    def _expire_alerts(self):
+        """Forget de-duplication keys whose window has passed."""
+        expiry = self._alert_expiry
+        now = time.monotonic()
+        while expiry and expiry[0][0] <= now:
+            self._active_alerts.discard(expiry.popleft()[1])
+
+    def _claim_alert(self, key: tuple[int, str]) -> bool:
+        """Record an alert for key unless one already fired within ALERT_DEDUP_SECONDS."""
+        self._expire_alerts()
+        if key in self._active_alerts:
+            return False
+        self._active_alerts.add(key)
+        self._alert_expiry.append((time.monotonic() + ALERT_DEDUP_SECONDS, key))
+        return True
 
     # ========================================================================
     # Main Loop
@@ -324,10 +480,13 @@ class EventProducer:
         # Generate a few normal events first before any anomalies
         warmup_count = 5
         event_count = 0
+        # Events are paced against a deadline, so time spent generating and
+        # submitting an event comes out of the wait rather than adding to it
+        next_at = time.monotonic()
 
         while self._running:
             try:
-                customer_id = random.choice(list(CUSTOMER_PROFILES.keys()))
+                customer_id = random.choice(CUSTOMER_IDS)
                 event_count += 1
 
                 # After warmup, sometimes generate anomalous events
@@ -343,14 +502,12 @@ class EventProducer:
                     event.anomaly_rule = rule
 
                     # De-duplicate: don't fire the same rule for the same customer within 60s
-                    dedup_key = f"{customer_id}-{rule}"
-                    if dedup_key not in self._active_alerts:
-                        self._active_alerts.add(dedup_key)
+                    if self._claim_alert((customer_id, rule)):
                         event.alert_triggered = True
 
                         logger.warning(
-                            f"⚠️ ANOMALY DETECTED: {rule} for customer {customer_id} "
-                            f"({CUSTOMER_PROFILES[customer_id]['name']}) — triggering investigation"
+                            "⚠️ ANOMALY DETECTED: %s for customer %s (%s) — triggering investigation",
+                            rule, customer_id, event.customer_name,
                         )
 
                         # Auto-submit alert to Layer 2
@@ -368,24 +525,26 @@ class EventProducer:
                                     severity=severity,
                                 )
                             except Exception as e:
-                                logger.error(f"Failed to submit alert: {e}")
-
-                        # Clear dedup after 60 seconds
-                        asyncio.get_event_loop().call_later(
-                            60.0, lambda k=dedup_key: self._active_alerts.discard(k)
-                        )
+                                logger.error("Failed to submit alert: %s", e)
 
                 # Broadcast to SSE subscribers
-                await self._broadcast(event)
+                self._broadcast(event)
 
                 # Wait for next event
                 jitter = random.uniform(-0.5, 0.5)
-                await asyncio.sleep(max(0.5, self.interval + jitter))
+                next_at += max(0.5, self.interval + jitter)
+                delay = next_at - time.monotonic()
+                if delay < 0:
+                    # Fell behind (e.g. a slow alert submit): resume from now
+                    # instead of bursting to catch up
+                    next_at -= delay
+                    delay = 0.0
+                await asyncio.sleep(delay)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Event producer error: {e}", exc_info=True)
+                logger.error("Event producer error: %s", e, exc_info=True)
                 await asyncio.sleep(1)
 
         logger.info("Event producer stopped")
@@ -18,7 +18,7 @@ Prerequisites:
 """
 
 import asyncio
-import json
+import functools
 import logging
 import os
 import sys
@@ -27,6 +27,7 @@ from datetime import timedelta
 from pathlib import Path
 from typing import Any
 
+import orjson
 from dotenv import load_dotenv
 
 # Load environment first so observability can read connection string
@@ -48,10 +49,23 @@ except ImportError:
     _observability_enabled = False
 
 # ------------------------------------------------------------------
-from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
+from azure.identity import (
+    ChainedTokenCredential,
+    DefaultAzureCredential,
+    EnvironmentCredential,
+    ManagedIdentityCredential,
+)
 from durabletask.azuremanaged.worker import DurableTaskSchedulerWorker
 from durabletask.task import ActivityContext, OrchestrationContext, Task, when_any
-from pydantic import BaseModel, ValidationError
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationError,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    field_validator,
+)
 
 from agent_framework import (
     AgentResponse,
@@ -83,12 +97,51 @@ if _observability_enabled:
 FRAUD_AGENT_NAME = "FraudAnalysisAgent"
 ANALYST_APPROVAL_EVENT = "AnalystDecision"
 
+# One credential per process, shared by the DTS worker and every agent run so
+# they all hit the same in-memory token cache. With AZURE_CLIENT_ID set, a
+# service principal from the environment and then that user-assigned managed
+# identity are tried before the developer sources of DefaultAzureCredential
+# (Azure CLI, ...).
+_AZURE_CLIENT_ID = os.getenv("AZURE_CLIENT_ID")
+_CREDENTIAL = (
+    ChainedTokenCredential(
+        EnvironmentCredential(),
+        ManagedIdentityCredential(client_id=_AZURE_CLIENT_ID),
+        DefaultAzureCredential(
+            exclude_environment_credential=True,
+            exclude_managed_identity_credential=True,
+            exclude_visual_studio_code_credential=True,
+            exclude_powershell_credential=True,
+        ),
+    )
+    if _AZURE_CLIENT_ID
+    else DefaultAzureCredential(
+        exclude_visual_studio_code_credential=True,
+        exclude_powershell_credential=True,
+    )
+)
+
 
 # ============================================================================
 # FraudAnalysisAgent - Custom agent wrapping the inner workflow
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=128)
+def _parse_alert_json(text: str) -> dict | None:
+    """Parse the alert JSON that opens an entity conversation.
+
+    Every re-investigation replays the full history, so the same opening
+    message is parsed again on each run; the result is cached. Callers must
+    treat the returned dict as read-only.
+    """
+    try:
+        alert_data = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return None
+    return alert_data if isinstance(alert_data, dict) else None
+
+
 class FraudAnalysisAgent(BaseAgent):
     """Custom agent that runs the fraud analysis workflow as a DTS entity.
 
@@ -134,14 +187,8 @@ class FraudAnalysisAgent(BaseAgent):
         mcp_tool = MCPStreamableHTTPTool(name="contoso_mcp", url=self._mcp_uri, timeout=30)
         async with mcp_tool:
             # Create chat client
-            azure_client_id = os.getenv("AZURE_CLIENT_ID")
-            credential = (
-                ManagedIdentityCredential(client_id=azure_client_id)
-                if azure_client_id
-                else DefaultAzureCredential()
-            )
             chat_client = AzureOpenAIChatClient(
-                credential=credential,
+                credential=_CREDENTIAL,
                 deployment_name=self._deployment_name,
             )
 
@@ -178,7 +225,7 @@ class FraudAnalysisAgent(BaseAgent):
             )
 
             # Return as AgentResponse so entity can persist in DurableAgentState
-            response_text = json.dumps(assessment_dict, indent=2)
+            response_text = orjson.dumps(assessment_dict).decode()
             return AgentResponse(
                 messages=[Message(role="assistant", contents=[Content.from_text(response_text)])],
             )
@@ -195,26 +242,22 @@ class FraudAnalysisAgent(BaseAgent):
 
         for msg in messages:
             # Extract text from message
-            text = ""
-            if hasattr(msg, "text") and msg.text:
+            if isinstance(msg, Message):
                 text = msg.text
-            elif hasattr(msg, "contents"):
-                for c in msg.contents:
-                    if hasattr(c, "text") and c.text:
-                        text += c.text
+                role = msg.role
+            else:
+                text = getattr(msg, "text", None) or "".join(
+                    getattr(c, "text", None) or "" for c in getattr(msg, "contents", ())
+                )
+                role = getattr(msg, "role", "")
 
             if not text:
                 continue
 
-            role = getattr(msg, "role", "")
-
             if role == "user":
                 if alert_data is None:
                     # First user message = alert JSON
-                    try:
-                        alert_data = json.loads(text)
-                    except json.JSONDecodeError:
-                        alert_data = None
+                    alert_data = _parse_alert_json(text)
                 else:
                     # Subsequent user messages = analyst feedback
                     context_parts.append(f"ANALYST FEEDBACK: {text}")
@@ -231,7 +274,13 @@ class FraudAnalysisAgent(BaseAgent):
 
 
 class FraudDetectionInput(BaseModel):
-    """Input for the fraud detection orchestration."""
+    """Input for the fraud detection orchestration.
+
+    Extra keys in the scheduled input (e.g. the backend's auto_detected
+    marker) are dropped without being validated.
+    """
+    model_config = ConfigDict(extra="ignore")
+
     alert_id: str
     customer_id: int
     alert_type: str
@@ -252,6 +301,50 @@ class AnalystDecision(BaseModel):
     analyst_id: str = "analyst"
 
 
+class AssessmentSummary(BaseModel):
+    """The assessment fields the activities log and report on.
+
+    Decoded straight from the assessment JSON; other fields are ignored.
+    A field that is null or the wrong type takes its default rather than
+    failing the whole assessment, as the old dict .get() lookups did.
+    """
+    alert_id: str = "unknown"
+    overall_risk_score: float = 0
+    recommended_action: str = "unknown"
+
+    @field_validator("*", mode="wrap")
+    @classmethod
+    def _default_if_invalid(
+        cls, value: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo
+    ) -> Any:
+        try:
+            return handler(value)
+        except ValidationError:
+            return cls.model_fields[info.field_name].get_default(call_default_factory=True)
+
+    @classmethod
+    def parse(cls, assessment_text: str) -> "AssessmentSummary":
+        """Decode assessment JSON, falling back to defaults if it is malformed."""
+        try:
+            return cls.model_validate_json(assessment_text)
+        except ValidationError:
+            return cls()
+
+
+class AgentAssessment(AssessmentSummary):
+    """The assessment fields the orchestration routes on.
+
+    Decoded straight from the agent response; other fields are ignored.
+    Activities only need the summary, so step_details is left out of
+    their input via summary_json().
+    """
+    step_details: dict[str, Any] = Field(default_factory=dict)
+
+    def summary_json(self) -> str:
+        """Serialize the AssessmentSummary fields for an activity input."""
+        return self.model_dump_json(exclude={"step_details"})
+
+
 class ActionResult(BaseModel):
     """Result from fraud action execution."""
     alert_id: str
@@ -267,20 +360,15 @@ class ActionResult(BaseModel):
 
 def notify_analyst(context: ActivityContext, assessment_text: str) -> str:
     """Activity to notify analyst for review."""
-    try:
-        assessment = json.loads(assessment_text)
-        alert_id = assessment.get("alert_id", "unknown")
-        risk_score = assessment.get("overall_risk_score", 0)
-        recommended = assessment.get("recommended_action", "unknown")
-    except (json.JSONDecodeError, AttributeError):
-        alert_id = "unknown"
-        risk_score = 0
-        recommended = "unknown"
+    assessment = AssessmentSummary.parse(assessment_text)
 
-    logger.info(f"[Activity] NOTIFICATION: Analyst review required for alert {alert_id}")
-    logger.info(f"[Activity] Risk Score: {risk_score}, Recommended: {recommended}")
+    logger.info("[Activity] NOTIFICATION: Analyst review required for alert %s", assessment.alert_id)
+    logger.info(
+        "[Activity] Risk Score: %s, Recommended: %s",
+        assessment.overall_risk_score, assessment.recommended_action,
+    )
 
-    return f"Analyst notified for alert {alert_id}"
+    return f"Analyst notified for alert {assessment.alert_id}"
 
 
 def execute_fraud_action(context: ActivityContext, decision_dict: dict) -> dict:
@@ -289,17 +377,17 @@ def execute_fraud_action(context: ActivityContext, decision_dict: dict) -> dict:
     action = decision_dict.get("approved_action", "unknown")
     analyst_id = decision_dict.get("analyst_id", "unknown")
 
-    logger.info(f"[Activity] Executing fraud action: {action} for alert {alert_id}")
-    logger.info(f"[Activity] Approved by analyst: {analyst_id}")
+    logger.info("[Activity] Executing fraud action: %s for alert %s", action, alert_id)
+    logger.info("[Activity] Approved by analyst: %s", analyst_id)
 
     if action == "lock_account":
-        logger.info(f"[Activity] 🔒 Account locked for alert {alert_id}")
+        logger.info("[Activity] 🔒 Account locked for alert %s", alert_id)
     elif action == "refund_charges":
-        logger.info(f"[Activity] 💰 Charges refunded for alert {alert_id}")
+        logger.info("[Activity] 💰 Charges refunded for alert %s", alert_id)
     elif action == "both":
-        logger.info(f"[Activity] 🔒💰 Account locked and charges refunded for alert {alert_id}")
+        logger.info("[Activity] 🔒💰 Account locked and charges refunded for alert %s", alert_id)
     elif action == "clear":
-        logger.info(f"[Activity] ✅ Alert cleared for {alert_id}")
+        logger.info("[Activity] ✅ Alert cleared for %s", alert_id)
 
     return ActionResult(
         alert_id=alert_id,
@@ -311,15 +399,11 @@ def execute_fraud_action(context: ActivityContext, decision_dict: dict) -> dict:
 
 def auto_clear_alert(context: ActivityContext, assessment_text: str) -> dict:
     """Activity to auto-clear low-risk alerts."""
-    try:
-        assessment = json.loads(assessment_text)
-        alert_id = assessment.get("alert_id", "unknown")
-        risk_score = assessment.get("overall_risk_score", 0)
-    except (json.JSONDecodeError, AttributeError):
-        alert_id = "unknown"
-        risk_score = 0
+    assessment = AssessmentSummary.parse(assessment_text)
+    alert_id = assessment.alert_id
+    risk_score = assessment.overall_risk_score
 
-    logger.info(f"[Activity] Auto-clearing low-risk alert {alert_id} (risk={risk_score})")
+    logger.info("[Activity] Auto-clearing low-risk alert %s (risk=%s)", alert_id, risk_score)
 
     return ActionResult(
         alert_id=alert_id,
@@ -331,13 +415,9 @@ def auto_clear_alert(context: ActivityContext, assessment_text: str) -> dict:
 
 def escalate_timeout(context: ActivityContext, assessment_text: str) -> dict:
     """Activity to escalate when analyst review times out."""
-    try:
-        assessment = json.loads(assessment_text)
-        alert_id = assessment.get("alert_id", "unknown")
-    except (json.JSONDecodeError, AttributeError):
-        alert_id = "unknown"
+    alert_id = AssessmentSummary.parse(assessment_text).alert_id
 
-    logger.warning(f"[Activity] ⚠️ ESCALATION: Analyst review timed out for alert {alert_id}")
+    logger.warning("[Activity] ⚠️ ESCALATION: Analyst review timed out for alert %s", alert_id)
 
     return ActionResult(
         alert_id=alert_id,
@@ -352,16 +432,46 @@ def send_notification(context: ActivityContext, result_dict: dict) -> str:
     alert_id = result_dict.get("alert_id", "unknown")
     action_taken = result_dict.get("action_taken", "unknown")
 
-    logger.info(f"[Activity] Sending final notification for alert {alert_id}")
-    logger.info(f"[Activity] Action taken: {action_taken}")
+    logger.info("[Activity] Sending final notification for alert %s", alert_id)
+    logger.info("[Activity] Action taken: %s", action_taken)
 
     return f"Notification sent for alert {alert_id}, action: {action_taken}"
 
 
+# ============================================================================
+# Custom Status
+# ============================================================================
+
+
+class _StatusWriter:
+    """Writes the orchestration's custom status for the UI.
+
+    The whole status dict is encoded with orjson on every write, so
+    step_details can be mutated freely between writes.
+    """
+
+    def __init__(self, context: OrchestrationContext):
+        self._context = context
+
+    def set(self, message: str, step_details: dict, risk_score: float | None) -> None:
+        self._context.set_custom_status(orjson.dumps({
+            "message": message,
+            "step_details": step_details,
+            "risk_score": risk_score,
+        }).decode())
+
+
 # ============================================================================
 # Main Orchestration (uses DurableAIAgentOrchestrationContext)
 # ============================================================================
 
+# Sent back to the same agent session when the analyst rejects an assessment.
+_FEEDBACK_TEMPLATE = (
+    "The analyst REJECTED the previous assessment and requests re-investigation.\n"
+    "Analyst feedback: {feedback}\n"
+    "Please conduct a deeper investigation focusing on the analyst's concerns."
+)
+
 
 def fraud_detection_orchestration(
     context: OrchestrationContext,
@@ -396,7 +506,7 @@ def fraud_detection_orchestration(
         raise ValueError(f"Invalid alert input: {exc}") from exc
 
     alert_id = payload.alert_id
-    logger.info(f"[Orchestration] Processing alert {alert_id}")
+    logger.info("[Orchestration] Processing alert %s", alert_id)
 
     # ========================================================================
     # Set up DurableAIAgentOrchestrationContext for agent entity calls
@@ -405,27 +515,19 @@ def fraud_detection_orchestration(
     agent_ctx = DurableAIAgentOrchestrationContext(context)
     fraud_agent = agent_ctx.get_agent(FRAUD_AGENT_NAME)
     fraud_session = fraud_agent.create_session()
+    status = _StatusWriter(context)
 
-    logger.info(f"[Orchestration] Created agent session: {fraud_session.session_id}")
+    logger.info("[Orchestration] Created agent session: %s", fraud_session.session_id)
 
     # ========================================================================
     # Step 1: Initial fraud analysis via DurableAIAgent entity
     # ========================================================================
 
-    alert_json = json.dumps({
-        "alert_id": payload.alert_id,
-        "customer_id": payload.customer_id,
-        "alert_type": payload.alert_type,
-        "description": payload.description,
-        "timestamp": payload.timestamp,
-        "severity": payload.severity,
-    })
-
-    context.set_custom_status(json.dumps({
-        "message": f"Running fraud analysis for {alert_id}",
-        "step_details": {},
-        "risk_score": None,
-    }))
+    alert_json = payload.model_dump_json(
+        exclude={"approval_timeout_hours", "max_review_attempts"}
+    )
+
+    status.set(f"Running fraud analysis for {alert_id}", {}, None)
 
     logger.info("[Orchestration] Step 1: Running fraud analysis via agent entity...")
 
@@ -435,11 +537,12 @@ def fraud_detection_orchestration(
     )
 
     # Parse assessment from agent response
-    assessment = json.loads(response.text)
-    risk_score = assessment.get("overall_risk_score", 0)
-    step_details = assessment.get("step_details", {})
+    assessment = AgentAssessment.model_validate_json(response.text)
+    risk_score = assessment.overall_risk_score
+    step_details = assessment.step_details
+    summary_json = assessment.summary_json()
 
-    logger.info(f"[Orchestration] Analysis complete: risk={risk_score:.2f}")
+    logger.info("[Orchestration] Analysis complete: risk=%.2f", risk_score)
 
     # ========================================================================
     # Step 2: Route based on risk score with HITL feedback loop
@@ -450,35 +553,33 @@ def fraud_detection_orchestration(
 
     if risk_score >= 0.6:
         # HIGH RISK - Human-in-the-loop with feedback loop
-        while attempt < payload.max_review_attempts:
-            attempt += 1
+        call_activity = context.call_activity
+        wait_for_external_event = context.wait_for_external_event
+        create_timer = context.create_timer
+        approval_timeout = timedelta(hours=payload.approval_timeout_hours)
+
+        for attempt in range(1, payload.max_review_attempts + 1):
             logger.info(
-                f"[Orchestration] HIGH RISK ({risk_score:.2f}) - "
-                f"Analyst review (attempt {attempt}/{payload.max_review_attempts})"
+                "[Orchestration] HIGH RISK (%.2f) - Analyst review (attempt %d/%d)",
+                risk_score, attempt, payload.max_review_attempts,
             )
 
-            context.set_custom_status(json.dumps({
-                "message": f"Awaiting analyst review (risk={risk_score:.2f}, attempt {attempt})",
-                "step_details": step_details,
-                "risk_score": risk_score,
-            }))
+            status.set(f"Awaiting analyst review (risk={risk_score:.2f}, attempt {attempt})", step_details, risk_score)
 
             # Notify analyst
-            yield context.call_activity("notify_analyst", input=response.text)
+            yield call_activity("notify_analyst", input=summary_json)
 
             # Wait for analyst decision OR timeout
-            approval_task: Task[Any] = context.wait_for_external_event(ANALYST_APPROVAL_EVENT)
-            timeout_task: Task[Any] = context.create_timer(
-                context.current_utc_datetime + timedelta(hours=payload.approval_timeout_hours)
-            )
+            approval_task: Task[Any] = wait_for_external_event(ANALYST_APPROVAL_EVENT)
+            timeout_task: Task[Any] = create_timer(context.current_utc_datetime + approval_timeout)
 
-            logger.info(f"[Orchestration] Waiting for analyst decision (timeout: {payload.approval_timeout_hours}h)")
+            logger.info("[Orchestration] Waiting for analyst decision (timeout: %sh)", payload.approval_timeout_hours)
             winner_task = yield when_any([approval_task, timeout_task])
 
             if winner_task == approval_task:
                 # Analyst responded
                 decision_data: Any = approval_task.get_result()
-                logger.info(f"[Orchestration] Received analyst decision: {decision_data}")
+                logger.info("[Orchestration] Received analyst decision: %s", decision_data)
 
                 # Parse decision
                 if isinstance(decision_data, dict):
@@ -494,7 +595,7 @@ def fraud_detection_orchestration(
                     # ====================================================
                     # APPROVED: Execute the action
                     # ====================================================
-                    logger.info(f"[Orchestration] ✅ Analyst approved: {decision.approved_action}")
+                    logger.info("[Orchestration] ✅ Analyst approved: %s", decision.approved_action)
 
                     step_details["review_gateway"] = {
                         "status": "completed",
@@ -506,13 +607,9 @@ def fraud_detection_orchestration(
                         "output": f"Action approved: {decision.approved_action}",
                     }
 
-                    context.set_custom_status(json.dumps({
-                        "message": "Executing analyst-approved action",
-                        "step_details": step_details,
-                        "risk_score": risk_score,
-                    }))
+                    status.set("Executing analyst-approved action", step_details, risk_score)
 
-                    action_result: dict = yield context.call_activity(
+                    action_result: dict = yield call_activity(
                         "execute_fraud_action",
                         input=decision.model_dump(),
                     )
@@ -534,7 +631,7 @@ def fraud_detection_orchestration(
                     # REJECTED: Re-investigate with feedback (SAME SESSION)
                     # ====================================================
                     feedback = decision.feedback or decision.analyst_notes or "No specific feedback"
-                    logger.info(f"[Orchestration] ❌ Analyst rejected. Feedback: {feedback}")
+                    logger.info("[Orchestration] ❌ Analyst rejected. Feedback: %s", feedback)
 
                     if attempt >= payload.max_review_attempts:
                         logger.warning("[Orchestration] Max review attempts exhausted")
@@ -542,14 +639,16 @@ def fraud_detection_orchestration(
                             "status": "completed",
                             "output": f"Max attempts ({payload.max_review_attempts}) exhausted",
                         }
-                        result = ActionResult(
-                            alert_id=alert_id,
-                            action_taken="max_attempts_exhausted",
-                            success=False,
-                            details=f"Could not resolve after {payload.max_review_attempts} reviews",
-                        ).model_dump()
+                        result = {
+                            "alert_id": alert_id,
+                            "action_taken": "max_attempts_exhausted",
+                            "success": False,
+                            "details": f"Could not resolve after {payload.max_review_attempts} reviews",
+                        }
                         break
 
+                    # Only lives until the re-investigation below replaces
+                    # step_details, but it is what the UI shows meanwhile.
                     step_details["review_gateway"] = {
                         "status": "rejected",
                         "tool_calls": [{
@@ -560,20 +659,12 @@ def fraud_detection_orchestration(
                         "output": f"Rejected - re-investigating (attempt {attempt + 1})",
                     }
 
-                    context.set_custom_status(json.dumps({
-                        "message": f"Re-investigating with analyst feedback (attempt {attempt + 1})",
-                        "step_details": step_details,
-                        "risk_score": risk_score,
-                    }))
+                    status.set(f"Re-investigating with analyst feedback (attempt {attempt + 1})", step_details, risk_score)
 
                     # *** STATEFUL RE-INVESTIGATION ***
                     # Same session -> entity retains full conversation history
                     # Agent sees: original alert + first analysis + feedback
-                    feedback_msg = (
-                        f"The analyst REJECTED the previous assessment and requests re-investigation.\n"
-                        f"Analyst feedback: {feedback}\n"
-                        f"Please conduct a deeper investigation focusing on the analyst's concerns."
-                    )
+                    feedback_msg = _FEEDBACK_TEMPLATE.format_map({"feedback": feedback})
 
                     logger.info("[Orchestration] Re-running fraud analysis with feedback context...")
 
@@ -583,48 +674,41 @@ def fraud_detection_orchestration(
                     )
 
                     # Parse updated assessment
-                    assessment = json.loads(response.text)
-                    risk_score = assessment.get("overall_risk_score", 0)
-                    step_details = assessment.get("step_details", {})
+                    assessment = AgentAssessment.model_validate_json(response.text)
+                    risk_score = assessment.overall_risk_score
+                    step_details = assessment.step_details
+                    summary_json = assessment.summary_json()
 
-                    logger.info(f"[Orchestration] Re-investigation complete: risk={risk_score:.2f}")
+                    logger.info("[Orchestration] Re-investigation complete: risk=%.2f", risk_score)
                     continue  # Loop back for another review
 
             else:
                 # Timeout - escalate
                 logger.warning("[Orchestration] Analyst review timed out")
-                context.set_custom_status(json.dumps({
-                    "message": "Review timed out - escalating",
-                    "step_details": step_details,
-                    "risk_score": risk_score,
-                }))
-
-                escalation_result: dict = yield context.call_activity(
-                    "escalate_timeout", input=response.text
+                status.set("Review timed out - escalating", step_details, risk_score)
+
+                escalation_result: dict = yield call_activity(
+                    "escalate_timeout", input=summary_json
                 )
                 result = escalation_result
                 break
 
         else:
-            # while loop exhausted without break (safety fallback)
-            result = ActionResult(
-                alert_id=alert_id,
-                action_taken="max_attempts_exhausted",
-                success=False,
-                details="Review loop exhausted",
-            ).model_dump()
+            # for loop exhausted without break (safety fallback)
+            result = {
+                "alert_id": alert_id,
+                "action_taken": "max_attempts_exhausted",
+                "success": False,
+                "details": "Review loop exhausted",
+            }
 
     else:
         # LOW RISK - Auto-clear
-        logger.info(f"[Orchestration] LOW RISK ({risk_score:.2f}) - Auto-clearing")
-        context.set_custom_status(json.dumps({
-            "message": f"Auto-clearing alert (risk={risk_score:.2f})",
-            "step_details": step_details,
-            "risk_score": risk_score,
-        }))
+        logger.info("[Orchestration] LOW RISK (%.2f) - Auto-clearing", risk_score)
+        status.set(f"Auto-clearing alert (risk={risk_score:.2f})", step_details, risk_score)
 
         clear_result: dict = yield context.call_activity(
-            "auto_clear_alert", input=response.text
+            "auto_clear_alert", input=summary_json
         )
         result = clear_result
 
@@ -638,11 +722,7 @@ def fraud_detection_orchestration(
     # ========================================================================
 
     logger.info("[Orchestration] Step 3: Sending final notification")
-    context.set_custom_status(json.dumps({
-        "message": "Sending notification",
-        "step_details": step_details,
-        "risk_score": risk_score,
-    }))
+    status.set("Sending notification", step_details, risk_score)
 
     yield context.call_activity("send_notification", input=result)
 
@@ -650,12 +730,9 @@ def fraud_detection_orchestration(
     # Complete
     # ========================================================================
 
-    logger.info(f"[Orchestration] ✅ Fraud detection completed for alert {alert_id}")
-    context.set_custom_status(json.dumps({
-        "message": "Completed",
-        "step_details": step_details,
-        "risk_score": risk_score,
-    }))
+    # No final custom status: the orchestration output carries step_details
+    # and the UI keys its completed state off the COMPLETED runtime status.
+    logger.info("[Orchestration] ✅ Fraud detection completed for alert %s", alert_id)
 
     return {
         "alert_id": alert_id,
@@ -677,14 +754,18 @@ def get_worker(
     taskhub: str | None = None,
     endpoint: str | None = None,
 ) -> DurableTaskSchedulerWorker:
-    """Create a configured DurableTaskSchedulerWorker."""
+    """Create a configured DurableTaskSchedulerWorker.
+
+    Not cached: each call returns a fresh worker, since a worker is started
+    and stopped. The expensive part, the credential, is already shared.
+    """
     taskhub_name = taskhub or os.getenv("DTS_TASKHUB", "default")
     endpoint_url = endpoint or os.getenv("DTS_ENDPOINT", "http://localhost:8080")
 
-    logger.info(f"Using DTS endpoint: {endpoint_url}")
-    logger.info(f"Using taskhub: {taskhub_name}")
+    logger.info("Using DTS endpoint: %s", endpoint_url)
+    logger.info("Using taskhub: %s", taskhub_name)
 
-    credential = None if endpoint_url.startswith("http://localhost") else DefaultAzureCredential()
+    credential = None if endpoint_url.startswith("http://localhost") else _CREDENTIAL
 
     return DurableTaskSchedulerWorker(
         host_address=endpoint_url,
@@ -710,13 +791,16 @@ def setup_worker(worker: DurableTaskSchedulerWorker) -> DurableAIAgentWorker:
     logger.info(f"✓ Registered entity: dafx-{fraud_agent.name}")
 
     # Register activity functions on the raw worker
-    logger.info("Registering activities...")
-    worker.add_activity(notify_analyst)
-    worker.add_activity(execute_fraud_action)
-    worker.add_activity(auto_clear_alert)
-    worker.add_activity(escalate_timeout)
-    worker.add_activity(send_notification)
-    logger.info("✓ Activities registered")
+    activities = (
+        notify_analyst,
+        execute_fraud_action,
+        auto_clear_alert,
+        escalate_timeout,
+        send_notification,
+    )
+    for activity in activities:
+        worker.add_activity(activity)
+    logger.info("✓ Registered %d activities", len(activities))
 
     # Register the orchestration on the raw worker
     logger.info("Registering orchestration...")
@@ -750,11 +834,16 @@ async def main():
         # Keep running — use threading.Event for Windows compatibility.
         # asyncio.sleep() can be cancelled by gRPC's SIGINT handler on Windows,
         # so we fall back to a thread-safe wait.
+        # Elsewhere an untimed wait is interrupted by Ctrl+C directly; on
+        # Windows it is not, so poll there to keep Ctrl+C responsive.
         import threading
         stop_event = threading.Event()
         try:
-            while not stop_event.wait(timeout=1):
-                pass
+            if sys.platform == "win32":
+                while not stop_event.wait(timeout=1):
+                    pass
+            else:
+                stop_event.wait()
         except (KeyboardInterrupt, asyncio.CancelledError):
             pass
     except KeyboardInterrupt:
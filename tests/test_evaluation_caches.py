@@ -0,0 +1,200 @@
+"""
+Unit tests for the evaluation framework's caches.
+
+Covers:
+1. ResponseCache modes (disabled / enabled / read-only / write-only / replay),
+   including the error-trace skip
+2. GraderCache modes
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+# The eval modules are scripts in agentic_ai/evaluations, imported by bare name
+EVALUATIONS_DIR = os.path.join(os.path.dirname(__file__), '..', 'agentic_ai', 'evaluations')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentic_ai'))
+sys.path.insert(0, EVALUATIONS_DIR)
+
+from metrics import GraderCache  # noqa: E402
+
+
+GRADER_KEY = GraderCache.key("coherence", "gpt-4o", {"query": "q", "response": "r"})
+GRADER_RESULT = {"coherence": 4.0, "coherence_reason": "clear"}
+
+
+def _seed_grader_cache(path: str) -> None:
+    GraderCache(path, "write-only").put(GRADER_KEY, GRADER_RESULT)
+
+
+# =============================================================================
+# Section 1: ResponseCache
+# =============================================================================
+
+
+@pytest.fixture(scope="module")
+def run_agent_eval():
+    """The eval script module; importing it only adjusts sys.path and loads .env."""
+    import run_agent_eval as module
+    return module
+
+
+TEST_CASE = {"customer_id": 1, "customer_query": "What is my balance?", "turns": []}
+
+
+def _trace(module, response="Your balance is $42.", **metadata):
+    return module.AgentTrace(
+        query=TEST_CASE["customer_query"],
+        response=response,
+        tool_calls=[{"name": "get_billing_summary"}],
+        metadata=metadata,
+    )
+
+
+class TestResponseCache:
+    """Read/write behaviour of each ResponseCache mode."""
+
+    def test_key_ignores_fields_the_backend_never_sees(self, run_agent_eval):
+        key = run_agent_eval.ResponseCache.key("single", "http://localhost:7000", TEST_CASE)
+        assert key == run_agent_eval.ResponseCache.key(
+            "single", "http://localhost:7000", {**TEST_CASE, "id": "TC-1", "category": "billing"}
+        )
+        assert key != run_agent_eval.ResponseCache.key("handoff", "http://localhost:7000", TEST_CASE)
+        assert key != run_agent_eval.ResponseCache.key(
+            "single", "http://localhost:7000", {**TEST_CASE, "customer_query": "Other question"}
+        )
+
+    def test_disabled_never_reads_or_writes(self, run_agent_eval, tmp_path):
+        path = tmp_path / "responses.jsonl"
+        cache = run_agent_eval.ResponseCache(path, "disabled")
+        cache.put("k", _trace(run_agent_eval))
+        assert cache.get("k") is None
+        assert not path.exists()
+
+    def test_enabled_round_trips_and_marks_cached_traces(self, run_agent_eval, tmp_path):
+        path = tmp_path / "responses.jsonl"
+        run_agent_eval.ResponseCache(path, "enabled").put("k", _trace(run_agent_eval, turn_count=1))
+
+        cached = run_agent_eval.ResponseCache(path, "enabled").get("k")
+        assert cached.response == "Your balance is $42."
+        assert cached.tool_calls == [{"name": "get_billing_summary"}]
+        assert cached.metadata == {"turn_count": 1, "from_cache": True}
+        assert run_agent_eval.ResponseCache(path, "enabled").get("missing") is None
+
+    def test_read_only_never_records(self, run_agent_eval, tmp_path):
+        path = tmp_path / "responses.jsonl"
+        run_agent_eval.ResponseCache(path, "write-only").put("k", _trace(run_agent_eval))
+        before = path.read_text()
+
+        cache = run_agent_eval.ResponseCache(path, "read-only")
+        assert cache.get("k") is not None
+        cache.put("other", _trace(run_agent_eval))
+        assert cache.get("other") is None
+        assert path.read_text() == before
+
+    def test_write_only_never_reads(self, run_agent_eval, tmp_path):
+        path = tmp_path / "responses.jsonl"
+        cache = run_agent_eval.ResponseCache(path, "write-only")
+        cache.put("k", _trace(run_agent_eval))
+        assert cache.get("k") is None
+        assert len(path.read_text().splitlines()) == 1
+
+    def test_replay_raises_on_miss(self, run_agent_eval, tmp_path):
+        path = tmp_path / "responses.jsonl"
+        run_agent_eval.ResponseCache(path, "write-only").put("k", _trace(run_agent_eval))
+
+        cache = run_agent_eval.ResponseCache(path, "replay")
+        assert cache.get("k") is not None
+        with pytest.raises(LookupError):
+            cache.get("missing")
+
+    def test_error_traces_are_not_recorded(self, run_agent_eval, tmp_path):
+        path = tmp_path / "responses.jsonl"
+        cache = run_agent_eval.ResponseCache(path, "enabled")
+        cache.put("failed", _trace(run_agent_eval, response="Error: backend unavailable"))
+        cache.put("raised", _trace(run_agent_eval, error="timeout"))
+        cache.put("turn", _trace(run_agent_eval, turn_responses=["ok", "Error: boom"]))
+        assert cache.get("failed") is None
+        assert cache.get("raised") is None
+        assert cache.get("turn") is None
+        assert not path.exists()
+
+
+# =============================================================================
+# Section 2: GraderCache
+# =============================================================================
+
+
+class TestGraderCache:
+    """Read/write behaviour of each GraderCache mode."""
+
+    def test_key_depends_on_name_deployment_and_inputs(self):
+        inputs = {"query": "q", "response": "r"}
+        assert GraderCache.key("coherence", "gpt-4o", inputs) == GRADER_KEY
+        assert GraderCache.key("fluency", "gpt-4o", inputs) != GRADER_KEY
+        assert GraderCache.key("coherence", "gpt-4.1", inputs) != GRADER_KEY
+        assert GraderCache.key("coherence", "gpt-4o", {**inputs, "response": "r2"}) != GRADER_KEY
+
+    def test_disabled_never_reads_or_writes(self, tmp_path):
+        path = str(tmp_path / "graders.jsonl")
+        _seed_grader_cache(path)
+
+        cache = GraderCache(path, "disabled")
+        assert cache.get(GRADER_KEY) is None
+
+        other = str(tmp_path / "other.jsonl")
+        GraderCache(other, "disabled").put(GRADER_KEY, GRADER_RESULT)
+        assert not os.path.exists(other)
+
+    def test_enabled_reads_existing_and_records_misses(self, tmp_path):
+        path = str(tmp_path / "graders.jsonl")
+        _seed_grader_cache(path)
+
+        cache = GraderCache(path, "enabled")
+        assert cache.get(GRADER_KEY) == GRADER_RESULT
+
+        miss_key = GraderCache.key("fluency", "gpt-4o", {"response": "r"})
+        assert cache.get(miss_key) is None
+        cache.put(miss_key, {"fluency": 3.0})
+        assert cache.get(miss_key) == {"fluency": 3.0}
+        # Recorded to disk, so a fresh cache sees it too
+        assert GraderCache(path, "enabled").get(miss_key) == {"fluency": 3.0}
+
+    def test_read_only_never_records(self, tmp_path):
+        path = str(tmp_path / "graders.jsonl")
+        _seed_grader_cache(path)
+        before = Path(path).read_text()
+
+        cache = GraderCache(path, "read-only")
+        assert cache.get(GRADER_KEY) == GRADER_RESULT
+        miss_key = GraderCache.key("fluency", "gpt-4o", {"response": "r"})
+        cache.put(miss_key, {"fluency": 3.0})
+        assert cache.get(miss_key) is None
+        assert Path(path).read_text() == before
+
+    def test_write_only_never_reads(self, tmp_path):
+        path = str(tmp_path / "graders.jsonl")
+        _seed_grader_cache(path)
+
+        cache = GraderCache(path, "write-only")
+        assert cache.get(GRADER_KEY) is None
+        cache.put(GRADER_KEY, {"coherence": 5.0})
+        assert len(Path(path).read_text().splitlines()) == 2
+        # Last write wins on reload
+        assert GraderCache(path, "read-only").get(GRADER_KEY) == {"coherence": 5.0}
+
+    def test_replay_raises_on_miss(self, tmp_path):
+        path = str(tmp_path / "graders.jsonl")
+        _seed_grader_cache(path)
+
+        cache = GraderCache(path, "replay")
+        assert cache.get(GRADER_KEY) == GRADER_RESULT
+        with pytest.raises(LookupError):
+            cache.get(GraderCache.key("fluency", "gpt-4o", {"response": "r"}))
+
+        cache.put(GRADER_KEY, {"coherence": 1.0})
+        assert GraderCache(path, "read-only").get(GRADER_KEY) == GRADER_RESULT
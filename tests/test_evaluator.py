@@ -0,0 +1,169 @@
+"""
+Unit tests for the evaluation runner.
+
+Covers:
+1. run_evaluation keeps dataset order when cases finish out of order
+2. The per-result JSONL stream
+3. Per-category pass counts in _generate_summary
+"""
+
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+# evaluator.py imports its sibling modules by bare name (from metrics import ...)
+EVALUATIONS_DIR = os.path.join(os.path.dirname(__file__), '..', 'agentic_ai', 'evaluations')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentic_ai'))
+sys.path.insert(0, EVALUATIONS_DIR)
+
+from metrics import EvaluationResult, MetricType  # noqa: E402
+# Module import: a bare TestCaseResult name would be collected as a test class
+import evaluator  # noqa: E402
+
+
+CASE_IDS = ["TC-1", "TC-2", "TC-3", "TC-4"]
+
+
+def _result(case_id: str) -> evaluator.TestCaseResult:
+    return evaluator.TestCaseResult(
+        test_case_id=case_id,
+        query="q",
+        agent_response="r",
+        metrics=[],
+        overall_score=1.0,
+        passed=True,
+        timestamp="2026-01-01T00:00:00",
+    )
+
+
+@pytest.fixture
+def runner(tmp_path):
+    dataset = tmp_path / "dataset.json"
+    dataset.write_text(json.dumps({
+        "test_cases": [{"id": case_id, "customer_query": f"query {case_id}"} for case_id in CASE_IDS]
+    }))
+    return evaluator.AgentEvaluationRunner(dataset_path=str(dataset), use_azure_evaluators=False)
+
+
+@pytest.fixture
+def finished(runner):
+    """Make each case wait for the one after it, so they finish in reverse order."""
+    done = {case_id: threading.Event() for case_id in CASE_IDS}
+    order = []
+
+    def evaluate(test_case, agent_trace):
+        index = CASE_IDS.index(test_case["id"])
+        if index + 1 < len(CASE_IDS):
+            assert done[CASE_IDS[index + 1]].wait(timeout=10)
+        order.append(test_case["id"])
+        done[test_case["id"]].set()
+        return _result(test_case["id"])
+
+    runner.evaluate_agent_response = evaluate
+    return order
+
+
+def _traces() -> list:
+    return [
+        evaluator.AgentTrace(query=f"query {case_id}", response="r", tool_calls=[], metadata={"test_id": case_id})
+        for case_id in reversed(CASE_IDS)
+    ]
+
+
+# =============================================================================
+# Section 1: Result ordering under concurrency
+# =============================================================================
+
+
+class TestRunEvaluationOrder:
+    """Cases are scored concurrently but reported in dataset order."""
+
+    def test_results_keep_dataset_order(self, runner, finished, tmp_path):
+        output_dir = tmp_path / "results"
+        summary = runner.run_evaluation(_traces(), output_dir=str(output_dir), max_workers=len(CASE_IDS))
+
+        assert finished == list(reversed(CASE_IDS))
+        assert summary["total_tests"] == len(CASE_IDS)
+
+        (results_file,) = output_dir.glob("eval_results_*.json")
+        saved = json.loads(results_file.read_text())
+        assert [r["test_case_id"] for r in saved["results"]] == CASE_IDS
+
+
+# =============================================================================
+# Section 2: JSONL result stream
+# =============================================================================
+
+
+class TestResultStream:
+    """Each result is streamed to JSONL as soon as it is scored."""
+
+    def test_stream_holds_each_scored_case_once(self, runner, finished, tmp_path):
+        output_dir = tmp_path / "results"
+        runner.run_evaluation(_traces(), output_dir=str(output_dir), max_workers=len(CASE_IDS))
+
+        (stream_file,) = output_dir.glob("eval_results_*.jsonl")
+        streamed = [json.loads(line) for line in stream_file.read_text().splitlines()]
+        assert sorted(r["test_case_id"] for r in streamed) == CASE_IDS
+
+        # The combined JSON shares the stream's timestamp
+        assert (output_dir / f"{stream_file.stem}.json").exists()
+
+
+# =============================================================================
+# Section 3: Summary category counters
+# =============================================================================
+
+
+def _categorized_result(case_id: str, category: str, passed: bool, score: float) -> evaluator.TestCaseResult:
+    return evaluator.TestCaseResult(
+        test_case_id=case_id,
+        query="q",
+        agent_response="r",
+        metrics=[EvaluationResult(
+            metric_name="completeness",
+            metric_type=MetricType.COMPLETENESS,
+            score=score,
+            passed=passed,
+            details={},
+            explanation="",
+        )],
+        overall_score=score,
+        passed=passed,
+        timestamp="2026-01-01T00:00:00",
+        category=category,
+    )
+
+
+class TestSummaryCategoryBreakdown:
+    """Per-category totals and pass rates in the run summary."""
+
+    def test_counts_each_category(self, runner):
+        summary = runner._generate_summary([
+            _categorized_result("TC-1", "billing", True, 0.9),
+            _categorized_result("TC-2", "billing", False, 0.3),
+            _categorized_result("TC-3", "billing", True, 0.8),
+            _categorized_result("TC-4", "security", False, 0.2),
+            _categorized_result("TC-5", "", True, 1.0),
+        ])
+
+        assert summary["total_tests"] == 5
+        assert summary["passed"] == 3
+        assert summary["failed"] == 2
+        assert summary["category_breakdown"] == {
+            "billing": {"total": 3, "passed": 2, "pass_rate": pytest.approx(2 / 3)},
+            "security": {"total": 1, "passed": 0, "pass_rate": 0.0},
+            "": {"total": 1, "passed": 1, "pass_rate": 1.0},
+        }
+        assert summary["metric_averages"]["completeness"] == pytest.approx(3.2 / 5)
+
+    def test_empty_run(self, runner):
+        summary = runner._generate_summary([])
+        assert summary["total_tests"] == 0
+        assert summary["pass_rate"] == 0.0
+        assert summary["category_breakdown"] == {}
@@ -0,0 +1,167 @@
+"""
+Unit tests for the fraud detection event producer's rule windows.
+
+Covers:
+1. Multi-country login window (2 hours)
+2. Rapid auth failure window (3+ in 5 minutes)
+3. Alert de-duplication expiry (ALERT_DEDUP_SECONDS)
+"""
+
+import os
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+pytest.importorskip("numpy")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentic_ai', 'workflow', 'fraud_detection_durable'))
+
+import event_producer  # noqa: E402
+from event_producer import ALERT_DEDUP_SECONDS, EventProducer, TelemetryEvent  # noqa: E402
+
+
+class FakeClock:
+    """Stands in for the time module so window edges can be hit exactly."""
+
+    def __init__(self, start: float = 10_000.0):
+        self.now = start
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(event_producer, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def producer():
+    return EventProducer()
+
+
+def _login(cid: int, country: str) -> TelemetryEvent:
+    return TelemetryEvent(
+        id="EVT-000001",
+        timestamp="2026-01-01T00:00:00.000000",
+        customer_id=cid,
+        customer_name=event_producer.CUSTOMER_NAMES[cid],
+        event_type="login",
+        details={"country": country, "ip": "192.168.1.1", "success": True},
+    )
+
+
+def _auth_failure(cid: int) -> TelemetryEvent:
+    return TelemetryEvent(
+        id="EVT-000002",
+        timestamp="2026-01-01T00:00:00.000000",
+        customer_id=cid,
+        customer_name=event_producer.CUSTOMER_NAMES[cid],
+        event_type="auth_failure",
+        details={"method": "password", "reason": "invalid_credentials", "ip": "185.1.1.1"},
+    )
+
+
+# =============================================================================
+# Section 1: Multi-country login window
+# =============================================================================
+
+
+class TestMultiCountryLoginWindow:
+    """A login from a second country only fires within 2 hours of the first."""
+
+    def test_second_country_within_window_fires(self, producer, clock):
+        assert producer._evaluate_rules(_login(1, "USA")) == (False, "")
+        clock.advance(3600)
+        assert producer._evaluate_rules(_login(1, "Russia")) == (True, "multi_country_login")
+
+    def test_same_country_does_not_fire(self, producer, clock):
+        for _ in range(3):
+            assert producer._evaluate_rules(_login(1, "USA")) == (False, "")
+            clock.advance(60)
+
+    def test_logins_expire_at_two_hours(self, producer, clock):
+        producer._evaluate_rules(_login(1, "USA"))
+        clock.advance(7200)
+        assert producer._evaluate_rules(_login(1, "Russia")) == (False, "")
+        # Expired entries are dropped from both columns together
+        assert list(producer._login_countries[1]) == ["Russia"]
+        assert list(producer._login_times[1]) == [clock.now]
+        clock.advance(60)
+        assert producer._evaluate_rules(_login(1, "USA")) == (True, "multi_country_login")
+
+    def test_windows_are_per_customer(self, producer, clock):
+        producer._evaluate_rules(_login(1, "USA"))
+        assert producer._evaluate_rules(_login(2, "Russia")) == (False, "")
+
+
+# =============================================================================
+# Section 2: Rapid auth failure window
+# =============================================================================
+
+
+class TestRapidAuthFailureWindow:
+    """Three failures inside 5 minutes fire; older ones fall out of the window."""
+
+    def test_third_failure_within_window_fires(self, producer, clock):
+        assert producer._evaluate_rules(_auth_failure(1)) == (False, "")
+        clock.advance(100)
+        assert producer._evaluate_rules(_auth_failure(1)) == (False, "")
+        clock.advance(100)
+        assert producer._evaluate_rules(_auth_failure(1)) == (True, "rapid_auth_failures")
+
+    def test_failures_expire_at_five_minutes(self, producer, clock):
+        producer._evaluate_rules(_auth_failure(1))
+        clock.advance(200)
+        producer._evaluate_rules(_auth_failure(1))
+        clock.advance(100)
+        # The first failure is exactly 300s old and no longer counts
+        assert producer._evaluate_rules(_auth_failure(1)) == (False, "")
+        assert len(producer._auth_failure_times[1]) == 2
+        clock.advance(50)
+        assert producer._evaluate_rules(_auth_failure(1)) == (True, "rapid_auth_failures")
+
+
+# =============================================================================
+# Section 3: Alert de-duplication expiry
+# =============================================================================
+
+
+class TestAlertDedupExpiry:
+    """A (customer, rule) alert is claimed once per ALERT_DEDUP_SECONDS."""
+
+    def test_repeat_suppressed_until_window_passes(self, producer, clock):
+        assert producer._claim_alert((1, "spending_spike"))
+
+        clock.advance(ALERT_DEDUP_SECONDS - 1)
+        assert not producer._claim_alert((1, "spending_spike"))
+
+        clock.advance(1)
+        assert producer._claim_alert((1, "spending_spike"))
+
+    def test_keys_expire_in_firing_order(self, producer, clock):
+        assert producer._claim_alert((1, "spending_spike"))
+        clock.advance(30)
+        assert producer._claim_alert((2, "data_usage_spike"))
+
+        clock.advance(ALERT_DEDUP_SECONDS - 30)
+        assert not producer._claim_alert((2, "data_usage_spike"))
+        assert producer._claim_alert((1, "spending_spike"))
+
+        clock.advance(30)
+        assert producer._claim_alert((2, "data_usage_spike"))
+
+    def test_keys_are_per_customer_and_rule(self, producer, clock):
+        assert producer._claim_alert((1, "spending_spike"))
+        assert producer._claim_alert((2, "spending_spike"))
+        assert producer._claim_alert((1, "rapid_auth_failures"))